@@ -11,6 +11,7 @@ import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -34,6 +35,11 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Leeway in seconds when validating the expiration of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+# Number of validated access tokens to remember
+VALIDATED_ACCESS_TOKEN_CACHE_SIZE = 512
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -192,6 +198,11 @@ class AuthManager:
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
         )
+        # Access tokens whose signature and claims were verified,
+        # with the time they stop being valid and their refresh token
+        self._validated_access_tokens: LRU[str, tuple[float, models.RefreshToken]] = (
+            LRU(VALIDATED_ACCESS_TOKEN_CACHE_SIZE)
+        )
 
     async def async_setup(self) -> None:
         """Set up the auth manager."""
@@ -650,7 +661,23 @@ class AuthManager:
 
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        The signature and claims of a token are only verified the first
+        time it is seen. After that the token is valid until it expires
+        as long as its refresh token was not removed and the user is
+        active.
+        """
+        if (validated := self._validated_access_tokens.get(token)) is not None:
+            valid_until, refresh_token = validated
+            if (
+                time.time() < valid_until
+                and self.async_get_refresh_token(refresh_token.id) is refresh_token
+                and refresh_token.user.is_active
+            ):
+                return refresh_token
+            del self._validated_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -668,8 +695,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -677,6 +708,10 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._validated_access_tokens[token] = (
+            claims["exp"] + ACCESS_TOKEN_LEEWAY,
+            refresh_token,
+        )
         return refresh_token
 
     @callback
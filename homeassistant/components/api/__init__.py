@@ -5,10 +5,12 @@ from asyncio import shield, timeout
 from functools import lru_cache
 from http import HTTPStatus
 import logging
+import secrets
 from typing import Any
 
 from aiohttp import web
-from aiohttp.web_exceptions import HTTPBadRequest
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPNotModified
 import voluptuous as vol
 
 from homeassistant.auth.models import User
@@ -46,7 +48,12 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, recorder, template
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.json import (
+    json_bytes,
+    json_bytes_array,
+    json_dumps,
+    json_fragment,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
@@ -204,33 +211,90 @@ class APIConfigView(HomeAssistantView):
         return self.json(request.app[KEY_HASS].config.as_dict())
 
 
+class _CachedJSONResponse:
+    """Pre-serialized JSON response body served with an ETag.
+
+    The ETag is prefixed with a random token so an ETag handed out
+    before a restart never matches a version counted after it.
+    """
+
+    __slots__ = ("_etag_prefix", "_updates", "body", "etag", "version")
+
+    def __init__(self) -> None:
+        """Initialize the cached response."""
+        self._etag_prefix = secrets.token_hex(8)
+        self._updates = 0
+        self.version: Any = None
+        self.body = b""
+        self.etag = ""
+
+    def update(self, version: Any, body: bytes) -> None:
+        """Update the cached body of a version."""
+        self._updates += 1
+        self.version = version
+        self.body = body
+        self.etag = f"{self._etag_prefix}-{self._updates:x}"
+
+    def response(self, request: web.Request) -> web.Response:
+        """Return the cached body or not modified if the client has it."""
+        if (if_none_match := request.if_none_match) is not None and any(
+            etag.value in (self.etag, ETAG_ANY) for etag in if_none_match
+        ):
+            response = web.Response(status=HTTPNotModified.status_code)
+        else:
+            response = _json_body_response(self.body)
+        response.etag = self.etag  # type: ignore[assignment]
+        return response
+
+
+def _json_body_response(body: bytes) -> web.Response:
+    """Return a response with a serialized JSON body."""
+    response = web.Response(
+        body=body,
+        content_type=CONTENT_TYPE_JSON,
+        zlib_executor_size=32768,
+    )
+    response.enable_compression()
+    return response
+
+
 class APIStatesView(HomeAssistantView):
     """View to handle States requests."""
 
     url = URL_API_STATES
     name = "api:states"
 
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._all_states = _CachedJSONResponse()
+
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        The states of users that may read all entities are cached until
+        any state changes and served with an ETag.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
-        if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
-        else:
-            entity_perm = user.permissions.check_entity
-            states = (
+        if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+            generation = hass.states.generation
+            if self._all_states.version != generation:
+                self._all_states.update(
+                    generation,
+                    json_bytes_array(
+                        state.as_dict_json for state in hass.states.async_all()
+                    ),
+                )
+            return self._all_states.response(request)
+        entity_perm = user.permissions.check_entity
+        return _json_body_response(
+            json_bytes_array(
                 state.as_dict_json
                 for state in hass.states.async_all()
-                if entity_perm(state.entity_id, "read")
+                if entity_perm(state.entity_id, POLICY_READ)
             )
-        response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
-            content_type=CONTENT_TYPE_JSON,
-            zlib_executor_size=32768,
         )
-        response.enable_compression()
-        return response
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -361,10 +425,22 @@ class APIServicesView(HomeAssistantView):
     url = URL_API_SERVICES
     name = "api:services"
 
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._services = _CachedJSONResponse()
+
     async def get(self, request: web.Request) -> web.Response:
-        """Get registered services."""
-        services = await async_services_json(request.app[KEY_HASS])
-        return self.json(services)
+        """Get registered services.
+
+        The services are cached until the service descriptions change
+        and served with an ETag.
+        """
+        descriptions = await async_get_all_descriptions(request.app[KEY_HASS])
+        if self._services.version is not descriptions:
+            self._services.update(
+                descriptions, json_bytes(_services_json(descriptions))
+            )
+        return self._services.response(request)
 
 
 class APIDomainServicesView(HomeAssistantView):
@@ -504,7 +580,13 @@ class APIErrorLog(HomeAssistantView):
 
 async def async_services_json(hass: HomeAssistant) -> list[dict[str, Any]]:
     """Generate services data to JSONify."""
-    descriptions = await async_get_all_descriptions(hass)
+    return _services_json(await async_get_all_descriptions(hass))
+
+
+def _services_json(
+    descriptions: dict[str, dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Generate services data to JSONify from the service descriptions."""
     return [{"domain": key, "services": value} for key, value in descriptions.items()]
 
 
@@ -89,10 +89,22 @@ def seen_all_fields(
     return True
 
 
+type _MatchKey = tuple[
+    str, frozenset[tuple[int, bytes]], frozenset[str], frozenset[str]
+]
+
+
 class IntegrationMatcher:
     """Integration matcher for the bluetooth integration."""
 
-    __slots__ = ("_integration_matchers", "_matched", "_matched_connectable", "_index")
+    __slots__ = (
+        "_integration_matchers",
+        "_matched",
+        "_matched_connectable",
+        "_not_matched",
+        "_not_matched_connectable",
+        "_index",
+    )
 
     def __init__(self, integration_matchers: list[BluetoothMatcher]) -> None:
         """Initialize the matcher."""
@@ -103,6 +115,12 @@ class IntegrationMatcher:
         self._matched_connectable: LRU[str, IntegrationMatchHistory] = LRU(
             MAX_REMEMBER_ADDRESSES
         )
+        # Addresses that did not match any integration, with the part
+        # of the advertisement the matchers depend on. The integration
+        # matchers never change after setup so the address only has to
+        # be matched again once that part of the advertisement changes.
+        self._not_matched: LRU[str, _MatchKey] = LRU(MAX_REMEMBER_ADDRESSES)
+        self._not_matched_connectable: LRU[str, _MatchKey] = LRU(MAX_REMEMBER_ADDRESSES)
         self._index = BluetoothMatcherIndex()
 
     @callback
@@ -116,6 +134,25 @@ class IntegrationMatcher:
         """Clear the history matches for a set of domains."""
         self._matched.pop(address, None)
         self._matched_connectable.pop(address, None)
+        self._not_matched.pop(address, None)
+        self._not_matched_connectable.pop(address, None)
+
+    def _match_key(self, service_info: BluetoothServiceInfoBleak) -> _MatchKey:
+        """Return the part of the advertisement the matchers depend on.
+
+        Only the leading manufacturer data bytes that a matcher compares
+        are included so changing sensor readings do not change the key.
+        """
+        data_start_length = self._index.manufacturer_data_start_length
+        return (
+            service_info.name,
+            frozenset(
+                (manufacturer_id, data[: data_start_length.get(manufacturer_id, 0)])
+                for manufacturer_id, data in service_info.manufacturer_data.items()
+            ),
+            frozenset(service_info.service_data),
+            frozenset(service_info.service_uuids),
+        )
 
     def match_domains(self, service_info: BluetoothServiceInfoBleak) -> set[str]:
         """Return the domains that are matched."""
@@ -129,11 +166,21 @@ class IntegrationMatcher:
         ):
             # We have seen all fields so we can skip the rest of the matchers
             return matched_domains
+        not_matched = (
+            self._not_matched_connectable if connectable else self._not_matched
+        )
+        match_key = self._match_key(service_info)
+        if not_matched.get(device.address) == match_key:
+            # Nothing the matchers depend on changed since the last miss
+            return matched_domains
         matched_domains = {
             matcher[DOMAIN] for matcher in self._index.match(service_info)
         }
         if not matched_domains:
+            if not previous_match:
+                not_matched[device.address] = match_key
             return matched_domains
+        not_matched.pop(device.address, None)
         if previous_match:
             previous_match.manufacturer_data |= bool(
                 advertisement_data.manufacturer_data
@@ -170,6 +217,7 @@ class BluetoothMatcherIndexBase[
         "service_uuid_set",
         "service_data_uuid_set",
         "manufacturer_id_set",
+        "manufacturer_data_start_length",
     )
 
     def __init__(self) -> None:
@@ -181,6 +229,7 @@ class BluetoothMatcherIndexBase[
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
+        self.manufacturer_data_start_length: dict[int, int] = {}
 
     def add(self, matcher: _T) -> bool:
         """Add a matcher to the index.
@@ -242,6 +291,25 @@ class BluetoothMatcherIndexBase[
         self.service_uuid_set = set(self.service_uuid)
         self.service_data_uuid_set = set(self.service_data_uuid)
         self.manufacturer_id_set = set(self.manufacturer_id)
+        # The longest manufacturer data prefix any matcher compares per
+        # manufacturer id, regardless of the bucket the matcher is in
+        data_start_length: dict[int, int] = {}
+        for bucket in (
+            self.local_name,
+            self.manufacturer_id,
+            self.service_uuid,
+            self.service_data_uuid,
+        ):
+            for matchers in bucket.values():
+                for matcher in matchers:
+                    if (manufacturer_id := matcher.get(MANUFACTURER_ID)) and (
+                        data_start := matcher.get(MANUFACTURER_DATA_START)
+                    ):
+                        data_start_length[manufacturer_id] = max(
+                            len(data_start),
+                            data_start_length.get(manufacturer_id, 0),
+                        )
+        self.manufacturer_data_start_length = data_start_length
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
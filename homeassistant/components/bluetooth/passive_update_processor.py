@@ -300,6 +300,13 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         self.last_update_success = True
         self.restore_data: dict[str, RestoredPassiveBluetoothDataUpdate] = {}
         self.restore_key = None
+        # The last advertisement dispatched to the processors
+        self._last_processed: BluetoothServiceInfoBleak | None = None
+        # Advertisements processed, skipped as they repeated the last
+        # processed one, and dropped while Home Assistant is stopping
+        self.processed_count = 0
+        self.duplicate_count = 0
+        self.dropped_count = 0
         if config_entry := config_entries.current_entry.get():
             self.restore_key = config_entry.entry_id
         self._on_stop.append(async_register_coordinator_for_restore(self.hass, self))
@@ -332,6 +339,8 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         # in the future, but is optional for now to allow
         # for a transition period.
         processor.async_register_coordinator(self, entity_description_class)
+        # Make sure the new processor sees the next advertisement
+        self._last_processed = None
 
         @callback
         def remove_processor() -> None:
@@ -352,9 +361,28 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
     ) -> None:
         """Handle the device going unavailable."""
         super()._async_handle_unavailable(service_info)
+        self._last_processed = None
         for processor in self._processors:
             processor.async_handle_unavailable()
 
+    @callback
+    def _async_is_duplicate(self, service_info: BluetoothServiceInfoBleak) -> bool:
+        """Return if the advertisement repeats the last processed one.
+
+        The manager drops advertisements identical to the previous one
+        from the same address, but the previous one may not have been
+        dispatched to this coordinator, for example a non-connectable
+        advertisement between two connectable ones. Only the last processed
+        advertisement is compared so a device returning to an earlier value
+        is still processed.
+        """
+        return (last := self._last_processed) is not None and not (
+            service_info.manufacturer_data != last.manufacturer_data
+            or service_info.service_data != last.service_data
+            or service_info.service_uuids != last.service_uuids
+            or service_info.name != last.name
+        )
+
     @callback
     def _async_handle_bluetooth_event(
         self,
@@ -365,6 +393,15 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         was_available = self._available
         self._available = True
         if self.hass.is_stopping:
+            self.dropped_count += 1
+            return
+        if (
+            was_available
+            and self.last_update_success
+            and self._async_is_duplicate(service_info)
+            and all(processor.last_update_success for processor in self._processors)
+        ):
+            self.duplicate_count += 1
             return
 
         try:
@@ -378,6 +415,9 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
             self.last_update_success = True
             self.logger.info("Coordinator %s recovered", self.name)
 
+        self._last_processed = service_info
+        self.processed_count += 1
+
         for processor in self._processors:
             processor.async_handle_update(update, was_available)
 
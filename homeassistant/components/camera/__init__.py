@@ -150,6 +150,8 @@ TOKEN_CHANGE_INTERVAL: Final = timedelta(minutes=5)
 _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
+# Snapshots are not reused unless a camera opts in
+DEFAULT_SNAPSHOT_MAX_AGE: Final = 0  # seconds
 
 CAMERA_SERVICE_SNAPSHOT: VolDictType = {vol.Required(ATTR_FILENAME): cv.template}
 
@@ -204,7 +206,44 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Snapshots are reused for each width and height for the snapshot
+    max age of the camera and concurrent callers share a single fetch.
     """
+    key = (width, height)
+    cache = camera._snapshot_cache  # noqa: SLF001
+    if cache:
+        _async_evict_expired_snapshots(camera, cache)
+        if (cached := cache.get(key)) is not None:
+            return cached[1]
+
+    fetches = camera._snapshot_fetches  # noqa: SLF001
+    if (fetch := fetches.get(key)) is None or fetch.done():
+        fetch = camera.hass.async_create_background_task(
+            _async_fetch_image(camera, timeout, width, height),
+            name=f"camera snapshot {camera.entity_id}",
+        )
+        fetch.add_done_callback(_async_snapshot_fetch_done)
+        if not fetch.done():
+            fetches[key] = fetch
+            fetch.add_done_callback(lambda _: fetches.pop(key, None))
+
+    with suppress(asyncio.CancelledError, TimeoutError):
+        async with asyncio.timeout(timeout):
+            if (image := await asyncio.shield(fetch)) is not None:
+                return image
+
+    raise HomeAssistantError("Unable to get image")
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image | None:
+    """Fetch and scale a snapshot image from a camera and cache it."""
+    image_bytes: bytes | None = None
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
             image_bytes = (
@@ -214,23 +253,48 @@ async def _async_get_image(
                 if camera.use_stream_for_stills
                 else await camera.async_camera_image(width=width, height=height)
             )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+    if not image_bytes:
+        return None
 
-                return image
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        image = Image(content_type, scale_jpeg_camera_image(image, width, height))
 
-    raise HomeAssistantError("Unable to get image")
+    if camera.snapshot_max_age:
+        cache = camera._snapshot_cache  # noqa: SLF001
+        _async_evict_expired_snapshots(camera, cache)
+        cache[(width, height)] = (time.monotonic(), image)
+    return image
+
+
+@callback
+def _async_snapshot_fetch_done(fetch: asyncio.Task[Image | None]) -> None:
+    """Retrieve the result of a snapshot fetch.
+
+    All callers may have given up waiting for a shared fetch, so the
+    exception is retrieved here to avoid it never being retrieved.
+    """
+    if not fetch.cancelled():
+        fetch.exception()
+
+
+@callback
+def _async_evict_expired_snapshots(
+    camera: Camera,
+    cache: dict[tuple[int | None, int | None], tuple[float, Image]],
+) -> None:
+    """Remove snapshots older than the snapshot max age of the camera."""
+    now = time.monotonic()
+    max_age = camera.snapshot_max_age
+    for expired_key in [
+        key for key, (fetched, _) in cache.items() if now - fetched >= max_age
+    ]:
+        del cache[expired_key]
 
 
 @bind_hass
@@ -452,6 +516,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "is_streaming",
     "model",
     "motion_detection_enabled",
+    "snapshot_max_age",
     "supported_features",
 }
 
@@ -472,6 +537,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_is_streaming: bool = False
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
+    _attr_snapshot_max_age: float = DEFAULT_SNAPSHOT_MAX_AGE
     _attr_should_poll: bool = False  # No need to poll cameras
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
@@ -488,6 +554,12 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self._snapshot_cache: dict[
+            tuple[int | None, int | None], tuple[float, Image]
+        ] = {}
+        self._snapshot_fetches: dict[
+            tuple[int | None, int | None], asyncio.Task[Image | None]
+        ] = {}
         self._webrtc_provider: CameraWebRTCProvider | None = None
         self._legacy_webrtc_provider: CameraWebRTCLegacyProvider | None = None
         self._supports_native_sync_webrtc = (
@@ -505,6 +577,11 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             return self._attr_entity_picture
         return ENTITY_IMAGE_URL.format(self.entity_id, self.access_tokens[-1])
 
+    @cached_property
+    def snapshot_max_age(self) -> float:
+        """Return how long a snapshot may be reused for other requests."""
+        return self._attr_snapshot_max_age
+
     @cached_property
     def use_stream_for_stills(self) -> bool:
         """Whether or not to use stream to generate stills."""
@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of states after which a partial historical stream message is sent
+HISTORY_STREAM_CHUNK_STATES = 10000
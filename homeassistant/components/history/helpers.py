@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from math import isfinite
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -31,3 +34,72 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def _append_bucket(
+    result: list[dict[str, Any]],
+    low: dict[str, Any] | None,
+    high: dict[str, Any] | None,
+) -> None:
+    """Append the extremes of a bucket in time order."""
+    if low is None or high is None:
+        return
+    if low is high:
+        result.append(low)
+    elif low[COMPRESSED_STATE_LAST_UPDATED] <= high[COMPRESSED_STATE_LAST_UPDATED]:
+        result.extend((low, high))
+    else:
+        result.extend((high, low))
+
+
+def downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample a list of compressed states to about max_points.
+
+    The time range is split into buckets and only the minimum and maximum
+    numeric state of each bucket is kept so peaks remain visible. The first
+    and last state and every non numeric state (unavailable, unknown, ...)
+    are always kept since dropping them would change the meaning of the
+    history.
+    """
+    if len(states) <= max_points:
+        return states
+    first_ts: float = states[0][COMPRESSED_STATE_LAST_UPDATED]
+    span = states[-1][COMPRESSED_STATE_LAST_UPDATED] - first_ts
+    buckets = max((max_points - 2) // 2, 1)
+    last_bucket = buckets - 1
+    scale = buckets / span if span else 0
+    result: list[dict[str, Any]] = [states[0]]
+    bucket = -1
+    low: dict[str, Any] | None = None
+    high: dict[str, Any] | None = None
+    low_value = high_value = 0.0
+    for state in states[1:-1]:
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except ValueError:
+            value = float("nan")
+        if not isfinite(value):
+            _append_bucket(result, low, high)
+            low = high = None
+            result.append(state)
+            continue
+        current = min(
+            int((state[COMPRESSED_STATE_LAST_UPDATED] - first_ts) * scale),
+            last_bucket,
+        )
+        if low is None or current != bucket:
+            _append_bucket(result, low, high)
+            bucket = current
+            low = high = state
+            low_value = high_value = value
+        elif value < low_value:
+            low = state
+            low_value = value
+        elif value > high_value:
+            high = state
+            high_value = value
+    _append_bucket(result, low, high)
+    result.append(states[-1])
+    return result
@@ -38,8 +38,16 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_STATES,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,25 +80,31 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points:
+        # The states are downsampled once they are all fetched, this reduces
+        # the size of the response but not the cost of the query
+        states = {
+            entity_id: downsample_compressed_states(
+                cast(list[dict[str, Any]], state_list), max_points
+            )
+            for entity_id, state_list in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +117,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(vol.Coerce(int), vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -167,6 +182,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -212,6 +228,7 @@ def _generate_websocket_response(
 
 def _generate_historical_response(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -222,30 +239,53 @@ def _generate_historical_response(
     no_attributes: bool,
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
-    )
+    """Generate a historical response.
+
+    States are converted in slices of at most HISTORY_STREAM_CHUNK_STATES
+    states and sent to the client as soon as a chunk is full, so large
+    queries do not have to be held in memory as a whole. Streaming stops
+    early once the client has unsubscribed. The remaining states are
+    returned as the final payload.
+    """
     last_time_ts = 0.0
-    for state_list in states.values():
+    states: dict[str, list[dict[str, Any]]] = {}
+    pending_states = 0
+    for entity_id, state_list in history.iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        HISTORY_STREAM_CHUNK_STATES,
+    ):
+        if pending_states + len(state_list) > HISTORY_STREAM_CHUNK_STATES:
+            hass.loop.call_soon_threadsafe(
+                connection.send_message,
+                _generate_websocket_response(
+                    msg_id,
+                    start_time,
+                    dt_util.utc_from_timestamp(last_time_ts),
+                    states,
+                ),
+            )
+            states = {}
+            pending_states = 0
+            # The subscription is removed from the event loop when the
+            # client unsubscribes or disconnects; there is no point in
+            # generating the rest of the history in that case.
+            if msg_id not in connection.subscriptions:
+                return last_time_ts, None, None
         if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+            state_last_time := cast(
+                float, state_list[-1][COMPRESSED_STATE_LAST_UPDATED]
+            )
+        ) > last_time_ts:
+            last_time_ts = state_last_time
+        states.setdefault(entity_id, []).extend(state_list)
+        pending_states += len(state_list)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -256,6 +296,9 @@ def _generate_historical_response(
         last_time_dt = end_time
     else:
         last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+        if not states:
+            # Everything has already been sent in chunks
+            return last_time_ts, last_time_dt, None
 
     return (
         last_time_ts,
@@ -282,6 +325,7 @@ async def _async_send_historical_states(
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
+        connection,
         msg_id,
         start_time,
         end_time,
@@ -66,6 +66,7 @@ from .cors import setup_cors
 from .decorators import require_admin  # noqa: F401
 from .forwarded import async_setup_forwarded
 from .headers import setup_headers
+from .metrics import HttpMetrics, HttpMetricsView, setup_metrics
 from .request_context import setup_request_context
 from .security_filter import setup_security_filter
 from .static import CACHE_HEADERS, CachingStaticResource
@@ -84,6 +85,7 @@ CONF_TRUSTED_PROXIES: Final = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD: Final = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED: Final = "ip_ban_enabled"
 CONF_SSL_PROFILE: Final = "ssl_profile"
+CONF_METRICS: Final = "metrics"
 
 SSL_MODERN: Final = "modern"
 SSL_INTERMEDIATE: Final = "intermediate"
@@ -133,6 +135,7 @@ HTTP_SCHEMA: Final = vol.All(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
             vol.Optional(CONF_USE_X_FRAME_OPTIONS, default=True): cv.boolean,
+            vol.Optional(CONF_METRICS, default=False): cv.boolean,
         }
     ),
 )
@@ -171,6 +174,7 @@ class ConfData(TypedDict, total=False):
     login_attempts_threshold: int
     ip_ban_enabled: bool
     ssl_profile: str
+    metrics: bool
 
 
 @bind_hass
@@ -220,6 +224,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    metrics = conf.get(CONF_METRICS, False)
 
     source_ip_task = create_eager_task(async_get_source_ip(hass))
 
@@ -239,6 +244,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
         use_x_frame_options=use_x_frame_options,
+        metrics=metrics,
     )
 
     async def stop_server(event: Event) -> None:
@@ -375,6 +381,7 @@ class HomeAssistantHTTP:
         self.runner: web.AppRunner | None = None
         self.site: HomeAssistantTCPSite | None = None
         self.context: ssl.SSLContext | None = None
+        self.metrics: HttpMetrics | None = None
 
     async def async_initialize(
         self,
@@ -384,6 +391,7 @@ class HomeAssistantHTTP:
         login_threshold: int,
         is_ban_enabled: bool,
         use_x_frame_options: bool,
+        metrics: bool = False,
     ) -> None:
         """Initialize the server."""
         self.app[KEY_HASS] = self.hass
@@ -405,6 +413,12 @@ class HomeAssistantHTTP:
         setup_headers(self.app, use_x_frame_options)
         setup_cors(self.app, cors_origins)
 
+        if metrics:
+            # Must go last so all other middlewares are timed
+            self.metrics = HttpMetrics()
+            setup_metrics(self.app, self.metrics)
+            self.register_view(HttpMetricsView(self.metrics))
+
         if self.ssl_certificate:
             self.context = await self.hass.async_add_executor_job(
                 self._create_ssl_context
@@ -14,6 +14,7 @@ from aiohttp import hdrs
 from aiohttp.web import Application, Request, StreamResponse, middleware
 import jwt
 from jwt import api_jws
+from lru import LRU
 from yarl import URL
 
 from homeassistant.auth import jwt_wrapper
@@ -35,6 +36,8 @@ DATA_API_PASSWORD: Final = "api_password"
 DATA_SIGN_SECRET: Final = "http.auth.sign_secret"
 SIGN_QUERY_PARAM: Final = "authSig"
 SAFE_QUERY_PARAMS: Final = frozenset(("height", "width"))
+# Number of verified path signatures to remember
+SIGNATURE_CACHE_SIZE: Final = 512
 
 STORAGE_VERSION = 1
 STORAGE_KEY = "http.auth"
@@ -142,6 +145,13 @@ async def async_setup_auth(
 
     hass.data[STORAGE_KEY] = refresh_token.id
 
+    # Claims of signatures that were already verified with the secret.
+    # Dashboards request the same signed paths over and over so this
+    # avoids verifying the signature on every request.
+    verified_signatures: LRU[str, tuple[str, dict[str, Any]]] = LRU(
+        SIGNATURE_CACHE_SIZE
+    )
+
     @callback
     def async_validate_auth_header(request: Request) -> bool:
         """Test authorization header against access token.
@@ -180,12 +190,24 @@ async def async_setup_auth(
         if (signature := request.query.get(SIGN_QUERY_PARAM)) is None:
             return False
 
-        try:
-            claims = jwt_wrapper.verify_and_decode(
-                signature, secret, algorithms=["HS256"], options={"verify_iss": False}
-            )
-        except jwt.InvalidTokenError:
-            return False
+        if (verified := verified_signatures.get(signature)) is not None and verified[
+            0
+        ] == secret:
+            claims = verified[1]
+            if claims["exp"] <= time.time():
+                del verified_signatures[signature]
+                return False
+        else:
+            try:
+                claims = jwt_wrapper.verify_and_decode(
+                    signature,
+                    secret,
+                    algorithms=["HS256"],
+                    options={"verify_iss": False},
+                )
+            except jwt.InvalidTokenError:
+                return False
+            verified_signatures[signature] = (secret, claims)
 
         if claims["path"] != request.path:
             return False
@@ -0,0 +1,300 @@
+"""Opt-in latency metrics of the HTTP request pipeline."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from itertools import accumulate
+import time
+from typing import Any, Final
+
+from aiohttp.hdrs import CONTENT_TYPE, UPGRADE
+from aiohttp.web import Application, Request, Response, StreamResponse, middleware
+
+from homeassistant.core import callback
+from homeassistant.helpers.http import HomeAssistantView
+
+from .decorators import require_admin
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Route of requests that did not match any registered resource
+UNMATCHED_ROUTE: Final = "<unmatched>"
+
+PROMETHEUS_CONTENT_TYPE: Final = "text/plain; version=0.0.4"
+
+# Route of a request whose response is written after the middlewares return
+KEY_METRICS_ROUTE: Final = "ha_metrics_route"
+
+type _Handler = Callable[[Request], Awaitable[StreamResponse]]
+type _Middleware = Callable[[Request, _Handler], Awaitable[StreamResponse]]
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Latency histogram of requests to a route or through a middleware."""
+
+    total: float = 0
+    max: float = 0
+    response_bytes: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a single request."""
+        self.total += duration
+        self.max = max(duration, self.max)
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        count = sum(self.buckets)
+        return {
+            "count": count,
+            "total": self.total,
+            "mean": self.total / count if count else 0,
+            "max": self.max,
+            "response_bytes": self.response_bytes,
+            "histogram": [
+                {"le": le, "count": count}
+                for le, count in zip(
+                    (*LATENCY_BUCKETS, None), self.buckets, strict=True
+                )
+            ],
+        }
+
+
+class HttpMetrics:
+    """Latency metrics of routes and middlewares.
+
+    Middleware latency only includes the time spent in the middleware
+    itself, the time spent in the handler it wraps is excluded. Websocket
+    connections stay open for their whole lifetime, so they are only
+    counted while open and not as requests in flight or route latency.
+    """
+
+    __slots__ = ("_started", "in_flight", "middlewares", "routes", "websockets")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.in_flight = 0
+        self.websockets = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the histograms, open requests and websockets are kept."""
+        self.routes: dict[tuple[str, str], LatencyHistogram] = {}
+        self.middlewares: dict[str, LatencyHistogram] = {}
+        self._started = time.monotonic()
+
+    def add_request(self, route: tuple[str, str], duration: float) -> None:
+        """Add a handled request."""
+        if (histogram := self.routes.get(route)) is None:
+            histogram = self.routes[route] = LatencyHistogram()
+        histogram.add(duration)
+
+    def add_response_bytes(self, route: tuple[str, str], response_bytes: int) -> None:
+        """Add the size of a response to a route."""
+        if (histogram := self.routes.get(route)) is not None:
+            histogram.response_bytes += response_bytes
+
+    def add_middleware(self, name: str, duration: float) -> None:
+        """Add the time a request spent in a middleware."""
+        if (histogram := self.middlewares.get(name)) is None:
+            histogram = self.middlewares[name] = LatencyHistogram()
+        histogram.add(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return {
+            "elapsed": time.monotonic() - self._started,
+            "in_flight": self.in_flight,
+            "websockets": self.websockets,
+            "routes": [
+                {"method": method, "route": route, **histogram.as_dict()}
+                for (method, route), histogram in self.routes.items()
+            ],
+            "middlewares": {
+                name: histogram.as_dict()
+                for name, histogram in self.middlewares.items()
+            },
+        }
+
+    def as_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP homeassistant_http_requests_in_flight"
+            " Requests currently being handled.",
+            "# TYPE homeassistant_http_requests_in_flight gauge",
+            f"homeassistant_http_requests_in_flight {self.in_flight}",
+            "# HELP homeassistant_http_websockets_open Websocket connections open.",
+            "# TYPE homeassistant_http_websockets_open gauge",
+            f"homeassistant_http_websockets_open {self.websockets}",
+            "# HELP homeassistant_http_request_duration_seconds"
+            " Time spent handling requests per route.",
+            "# TYPE homeassistant_http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in self.routes.items():
+            _add_prometheus_histogram(
+                lines,
+                "homeassistant_http_request_duration_seconds",
+                f'method="{_escape(method)}",route="{_escape(route)}"',
+                histogram,
+            )
+        lines.extend(
+            (
+                "# HELP homeassistant_http_response_size_bytes_total"
+                " Response body bytes per route.",
+                "# TYPE homeassistant_http_response_size_bytes_total counter",
+            )
+        )
+        lines.extend(
+            "homeassistant_http_response_size_bytes_total"
+            f'{{method="{_escape(method)}",route="{_escape(route)}"}}'
+            f" {histogram.response_bytes}"
+            for (method, route), histogram in self.routes.items()
+        )
+        lines.extend(
+            (
+                "# HELP homeassistant_http_middleware_duration_seconds"
+                " Time spent in middlewares excluding the wrapped handler.",
+                "# TYPE homeassistant_http_middleware_duration_seconds histogram",
+            )
+        )
+        for name, histogram in self.middlewares.items():
+            _add_prometheus_histogram(
+                lines,
+                "homeassistant_http_middleware_duration_seconds",
+                f'middleware="{_escape(name)}"',
+                histogram,
+            )
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _add_prometheus_histogram(
+    lines: list[str], metric: str, labels: str, histogram: LatencyHistogram
+) -> None:
+    """Add the lines of a histogram in the Prometheus text exposition format."""
+    cumulative = list(accumulate(histogram.buckets))
+    lines.extend(
+        f'{metric}_bucket{{{labels},le="{le}"}} {count}'
+        for le, count in zip((*LATENCY_BUCKETS, "+Inf"), cumulative, strict=True)
+    )
+    lines.append(f"{metric}_sum{{{labels}}} {histogram.total}")
+    lines.append(f"{metric}_count{{{labels}}} {cumulative[-1]}")
+
+
+def _request_route(request: Request) -> tuple[str, str]:
+    """Return the method and canonical path of the route of a request.
+
+    The canonical path is used so requests to the same view with
+    different path parameters share a histogram.
+    """
+    route = request.match_info.route
+    if (resource := route.resource) is None:
+        return ("*", UNMATCHED_ROUTE)
+    return (route.method, resource.canonical)
+
+
+def _is_websocket_upgrade(request: Request) -> bool:
+    """Return if a request upgrades the connection to a websocket."""
+    return request.headers.get(UPGRADE, "").lower() == "websocket"
+
+
+def _timed_middleware(metrics: HttpMetrics, wrapped: _Middleware) -> _Middleware:
+    """Wrap a middleware to record the time spent in it."""
+    name = getattr(wrapped, "__name__", repr(wrapped))
+
+    @middleware
+    async def timed_middleware(request: Request, handler: _Handler) -> StreamResponse:
+        """Record the time spent in the middleware."""
+        inner = 0.0
+
+        async def timed_handler(request: Request) -> StreamResponse:
+            nonlocal inner
+            start = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                inner += time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            return await wrapped(request, timed_handler)
+        finally:
+            metrics.add_middleware(name, time.perf_counter() - start - inner)
+
+    return timed_middleware
+
+
+@callback
+def setup_metrics(app: Application, metrics: HttpMetrics) -> None:
+    """Record the latency of routes and the middlewares already set up.
+
+    Must be called after all other middlewares are set up. When
+    metrics are not enabled this is not called and adds no overhead.
+    """
+
+    @middleware
+    async def metrics_middleware(request: Request, handler: _Handler) -> StreamResponse:
+        """Record the latency, response size and requests in flight."""
+        if _is_websocket_upgrade(request):
+            metrics.websockets += 1
+            try:
+                return await handler(request)
+            finally:
+                metrics.websockets -= 1
+
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            response = await handler(request)
+        finally:
+            metrics.in_flight -= 1
+            route = request[KEY_METRICS_ROUTE] = _request_route(request)
+            metrics.add_request(route, time.perf_counter() - start)
+        if response.prepared:
+            # The handler wrote the response itself
+            metrics.add_response_bytes(route, response.body_length)
+        return response
+
+    async def on_response_prepare(request: Request, response: StreamResponse) -> None:
+        """Record the size of a response written after the middlewares return.
+
+        Responses such as files are only prepared after the middlewares
+        return, their final size is known once they are prepared.
+        """
+        if (route := request.get(KEY_METRICS_ROUTE)) is not None:
+            metrics.add_response_bytes(route, response.content_length or 0)
+
+    app.on_response_prepare.append(on_response_prepare)
+    app.middlewares[:] = [
+        metrics_middleware,
+        *(_timed_middleware(metrics, wrapped) for wrapped in app.middlewares),
+    ]
+
+
+class HttpMetricsView(HomeAssistantView):
+    """Expose the HTTP metrics in the Prometheus text exposition format."""
+
+    url = "/api/http_metrics"
+    name = "api:http_metrics"
+
+    def __init__(self, metrics: HttpMetrics) -> None:
+        """Initialize the view."""
+        self._metrics = metrics
+
+    @require_admin
+    async def get(self, request: Request) -> Response:
+        """Return the metrics."""
+        return Response(
+            body=self._metrics.as_prometheus().encode(),
+            headers={CONTENT_TYPE: PROMETHEUS_CONTENT_TYPE},
+        )
@@ -39,18 +39,31 @@ FILTERS: Final = re.compile(
 
 # Unsafe bytes to be removed per WHATWG spec
 UNSAFE_URL_BYTES = ["\t", "\r", "\n"]
+UNSAFE_URL_BYTES_PATTERN: Final = re.compile(f"[{''.join(UNSAFE_URL_BYTES)}]")
+
+# Number of path and query string verdicts to remember
+FILTER_CACHE_SIZE: Final = 1024
+
+
+def _recursive_unquote(value: str) -> str:
+    """Handle values that are encoded multiple times."""
+    while (unquoted := unquote(value)) != value:
+        value = unquoted
+    return value
 
 
 @callback
 def setup_security_filter(app: Application) -> None:
     """Create security filter middleware for the app."""
 
-    @lru_cache
-    def _recursive_unquote(value: str) -> str:
-        """Handle values that are encoded multiple times."""
-        if (unquoted := unquote(value)) != value:
-            unquoted = _recursive_unquote(unquoted)
-        return unquoted
+    @lru_cache(maxsize=FILTER_CACHE_SIZE)
+    def _is_filtered(value: str) -> bool:
+        """Return if a value matches the filters once fully unquoted.
+
+        Clients poll the same paths over and over, so the verdict is
+        cached to avoid unquoting and searching on every request.
+        """
+        return FILTERS.search(_recursive_unquote(value)) is not None
 
     @middleware
     async def security_filter_middleware(
@@ -59,25 +72,24 @@ def setup_security_filter(app: Application) -> None:
         """Process request and block commonly known exploit attempts."""
         path_with_query_string = f"{request.path}?{request.query_string}"
 
-        for unsafe_byte in UNSAFE_URL_BYTES:
-            if unsafe_byte in path_with_query_string:
-                if unsafe_byte in request.query_string:
-                    _LOGGER.warning(
-                        "Filtered a request with unsafe byte query string: %s",
-                        request.raw_path,
-                    )
-                    raise HTTPBadRequest
+        if UNSAFE_URL_BYTES_PATTERN.search(path_with_query_string):
+            if UNSAFE_URL_BYTES_PATTERN.search(request.query_string):
                 _LOGGER.warning(
-                    "Filtered a request with an unsafe byte in path: %s",
+                    "Filtered a request with unsafe byte query string: %s",
                     request.raw_path,
                 )
                 raise HTTPBadRequest
+            _LOGGER.warning(
+                "Filtered a request with an unsafe byte in path: %s",
+                request.raw_path,
+            )
+            raise HTTPBadRequest
 
-        if FILTERS.search(_recursive_unquote(path_with_query_string)):
+        if _is_filtered(path_with_query_string):
             # Check the full path with query string first, if its
             # a hit, than check just the query string to give a more
             # specific warning.
-            if FILTERS.search(_recursive_unquote(request.query_string)):
+            if _is_filtered(request.query_string):
                 _LOGGER.warning(
                     "Filtered a request with a potential harmful query string: %s",
                     request.raw_path,
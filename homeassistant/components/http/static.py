@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from stat import S_ISREG
+import time
 from typing import Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    ACCEPT_RANGES,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    IF_MATCH,
+    IF_RANGE,
+    IF_UNMODIFIED_SINCE,
+    RANGE,
+    VARY,
+)
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPNotModified
+from aiohttp.web_fileresponse import (
+    CONTENT_TYPES,
+    ENCODING_EXTENSIONS,
+    FALLBACK_CONTENT_TYPE,
+)
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
@@ -17,20 +38,203 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
 
+# Files up to this size are kept in memory
+MEMORY_CACHE_MAX_FILE_SIZE: Final = 64 * 1024
+# Total size of the files kept in memory
+MEMORY_CACHE_MAX_SIZE: Final = 8 * 1024 * 1024
+# Files kept in memory are checked for changes at most this often
+MEMORY_CACHE_REVALIDATE_INTERVAL: Final = 5
+
+# Requests with these headers are always served by FileResponse
+_FILE_RESPONSE_ONLY_HEADERS = (RANGE, IF_MATCH, IF_RANGE, IF_UNMODIFIED_SINCE)
+
+
+@dataclass(slots=True)
+class _CachedFile:
+    """A static file kept in memory."""
+
+    path: Path
+    body: bytes
+    encoding: str | None
+    mtime_ns: int
+    etag: str
+    last_modified: float
+    validated: float
+
+
+def _load_file(path: Path, encodings: tuple[str, ...]) -> _CachedFile | None:
+    """Load a file or its pre-compressed variant if it is small enough.
+
+    Matches the variant selection of FileResponse.
+    This method should be called from a thread executor.
+    """
+    for file_extension, file_encoding in ENCODING_EXTENSIONS.items():
+        if file_encoding not in encodings:
+            continue
+        compressed_path = path.with_suffix(path.suffix + file_extension)
+        try:
+            st = compressed_path.lstat()
+        except OSError:
+            continue
+        if S_ISREG(st.st_mode):
+            path, encoding = compressed_path, file_encoding
+            break
+    else:
+        st = path.stat()
+        encoding = None
+    if not S_ISREG(st.st_mode) or st.st_size > MEMORY_CACHE_MAX_FILE_SIZE:
+        return None
+    body = path.read_bytes()
+    return _CachedFile(
+        path,
+        body,
+        encoding,
+        st.st_mtime_ns,
+        f"{st.st_mtime_ns:x}-{len(body):x}",
+        st.st_mtime,
+        time.monotonic(),
+    )
+
+
+def _is_unchanged(cached: _CachedFile) -> bool:
+    """Check if a file kept in memory is unchanged on disk.
+
+    This method should be called from a thread executor.
+    """
+    try:
+        st = cached.path.stat()
+    except OSError:
+        return False
+    return st.st_mtime_ns == cached.mtime_ns and st.st_size == len(cached.body)
+
+
+class _MemoryFileCache:
+    """Keep small static files in memory up to a total size."""
+
+    __slots__ = ("_files", "_not_cached", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._files: LRU[tuple[Path, tuple[str, ...]], _CachedFile] = LRU(
+            MEMORY_CACHE_MAX_SIZE // 1024
+        )
+        # Files that were too large to keep in memory when last checked
+        self._not_cached: LRU[tuple[Path, tuple[str, ...]], float] = LRU(512)
+        self._size = 0
+
+    async def async_get(
+        self, path: Path, encodings: tuple[str, ...]
+    ) -> _CachedFile | None:
+        """Return a file from memory, loading or revalidating it when needed."""
+        key = (path, encodings)
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        if (cached := self._files.get(key)) is not None:
+            if now - cached.validated < MEMORY_CACHE_REVALIDATE_INTERVAL:
+                return cached
+            if await loop.run_in_executor(None, _is_unchanged, cached):
+                cached.validated = now
+                return cached
+            self._pop(key)
+        elif (
+            checked := self._not_cached.get(key)
+        ) is not None and now - checked < MEMORY_CACHE_REVALIDATE_INTERVAL:
+            return None
+        try:
+            cached = await loop.run_in_executor(None, _load_file, path, encodings)
+        except OSError:
+            return None
+        if cached is None:
+            self._not_cached[key] = now
+            return None
+        self._pop(key)
+        self._files[key] = cached
+        self._size += len(cached.body)
+        while self._size > MEMORY_CACHE_MAX_SIZE:
+            self._size -= len(self._files.popitem(least_recent=True)[1].body)
+        return cached
+
+    def _pop(self, key: tuple[Path, tuple[str, ...]]) -> None:
+        """Remove a file from memory."""
+        if (cached := self._files.pop(key, None)) is not None:
+            self._size -= len(cached.body)
+
+    def clear(self) -> None:
+        """Remove all files from memory."""
+        self._files.clear()
+        self._not_cached.clear()
+        self._size = 0
+
+
+MEMORY_CACHE = _MemoryFileCache()
+
+
+async def _async_memory_response(
+    request: Request, file_path: Path, content_type: str
+) -> Response | None:
+    """Return a response for a small file from memory.
+
+    Returns None if the request must be served by FileResponse.
+    """
+    headers = request.headers
+    if any(header in headers for header in _FILE_RESPONSE_ONLY_HEADERS):
+        return None
+    accept_encoding = headers.get(ACCEPT_ENCODING, "").lower()
+    encodings = tuple(
+        file_encoding
+        for file_encoding in ENCODING_EXTENSIONS.values()
+        if file_encoding in accept_encoding
+    )
+    if (cached := await MEMORY_CACHE.async_get(file_path, encodings)) is None:
+        return None
+
+    if (if_none_match := request.if_none_match) is not None:
+        not_modified = any(
+            etag.value in (cached.etag, ETAG_ANY) for etag in if_none_match
+        )
+    else:
+        not_modified = (
+            modified_since := request.if_modified_since
+        ) is not None and cached.last_modified <= modified_since.timestamp()
+
+    if not_modified:
+        response = Response(status=HTTPNotModified.status_code)
+    else:
+        response = Response(body=cached.body)
+        response.headers[CONTENT_TYPE] = content_type
+        response.headers[ACCEPT_RANGES] = "bytes"
+        if cached.encoding:
+            response.headers[CONTENT_ENCODING] = cached.encoding
+            response.headers[VARY] = ACCEPT_ENCODING
+    response.etag = cached.etag  # type: ignore[assignment]
+    response.last_modified = cached.last_modified  # type: ignore[assignment]
+    return response
+
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
     async def _handle(self, request: Request) -> StreamResponse:
-        """Wrap base handler to cache file path resolution and content type guess."""
+        """Wrap base handler to cache file path resolution and content type guess.
+
+        Once the path of a file is resolved, small files are served from
+        memory.
+        """
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory)
         response: StreamResponse
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
+            if (
+                memory_response := await _async_memory_response(
+                    request, file_path, content_type
+                )
+            ) is not None:
+                response = memory_response
+            else:
+                response = FileResponse(file_path, chunk_size=self._chunk_size)
+                response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
@@ -17,8 +17,10 @@ from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.singleton import singleton
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
 from .helpers import (
@@ -35,6 +37,10 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many recently humanified live events are shared between streams
+MAX_LIVE_INDEX_EVENTS = 2048
+
+LOGBOOK_LIVE_INDEX: HassKey[LogbookLiveIndex] = HassKey("logbook_live_index")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +56,54 @@ class LogbookLiveStream:
     wait_sync_task: asyncio.Task | None = None
 
 
+class LogbookLiveIndex:
+    """Share humanified live events between logbook streams.
+
+    Once a stream has switched to live mode, humanifying an event no
+    longer depends on the stream that received it since the context is
+    resolved from the origin event. Every live stream receives the same
+    Event objects from the bus, so each event only needs to be humanified
+    once no matter how many streams are subscribed to it.
+    """
+
+    __slots__ = ("_event_processor", "_rows")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the live index."""
+        self._event_processor = EventProcessor(
+            hass, (), timestamp=True, include_entity_name=False
+        )
+        self._event_processor.switch_to_live()
+        self._rows: dict[Event, dict[str, Any] | None] = {}
+
+    @callback
+    def async_humanify(self, events: list[Event]) -> list[dict[str, Any]]:
+        """Humanify live events, reusing rows other streams already built."""
+        rows = self._rows
+        logbook_events: list[dict[str, Any]] = []
+        for event in events:
+            if event in rows:
+                row = rows[event]
+            else:
+                humanified = self._event_processor.humanify(
+                    (async_event_to_row(event),)
+                )
+                row = humanified[0] if humanified else None
+                if len(rows) >= MAX_LIVE_INDEX_EVENTS:
+                    del rows[next(iter(rows))]
+                rows[event] = row
+            if row is not None:
+                logbook_events.append(row)
+        return logbook_events
+
+
+@callback
+@singleton(LOGBOOK_LIVE_INDEX)
+def async_get_live_index(hass: HomeAssistant) -> LogbookLiveIndex:
+    """Get the shared logbook live index."""
+    return LogbookLiveIndex(hass)
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
@@ -217,6 +271,7 @@ async def _async_events_consumer(
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
+    live_index = async_get_live_index(event_processor.hass)
     while True:
         events: list[Event] = [await stream_queue.get()]
         # If the event is older than the last db
@@ -231,9 +286,16 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
+        if event_processor.logbook_run.memoize_new_contexts:
+            # Still catching up with the database so the contexts
+            # may come from rows only this stream has seen
+            logbook_events = event_processor.humanify(
+                async_event_to_row(e) for e in events
+            )
+        else:
+            logbook_events = live_index.async_humanify(events)
+
+        if logbook_events:
             connection.send_message(
                 json_bytes(
                     messages.event_message(
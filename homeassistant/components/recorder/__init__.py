@@ -7,6 +7,7 @@ from typing import Any
 
 import voluptuous as vol
 
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorStateClass
 from homeassistant.const import (
     CONF_EXCLUDE,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,  # noqa: F401
@@ -14,6 +15,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -38,6 +40,7 @@ from .const import (  # noqa: F401
     SupportedDialect,
 )
 from .core import Recorder
+from .sampling import SamplingPolicy, StateSampler
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -61,6 +64,11 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SAMPLING = "sampling"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_DEADBAND = "deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_KEEP_LAST = "keep_last"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -72,6 +80,21 @@ FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
 )
 
 
+SAMPLING_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MIN_INTERVAL): cv.positive_time_period,
+        vol.Optional(CONF_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_RELATIVE_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional(CONF_KEEP_LAST, default=False): cv.boolean,
+    }
+)
+
+# Sampling policies are keyed by entity_id or domain
+SAMPLING_SCHEMA = vol.Schema({vol.Any(cv.entity_id, cv.slug): SAMPLING_POLICY_SCHEMA})
+
+
 ALLOW_IN_MEMORY_DB = False
 
 
@@ -113,6 +136,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SAMPLING, default=dict): SAMPLING_SCHEMA,
                 }
             ),
         )
@@ -152,6 +176,24 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
+    sampling = _async_reject_sampling_with_sum(hass, conf[CONF_SAMPLING])
+    state_sampler = (
+        StateSampler(
+            {
+                key: SamplingPolicy(
+                    min_interval=policy[CONF_MIN_INTERVAL].total_seconds()
+                    if CONF_MIN_INTERVAL in policy
+                    else 0,
+                    deadband=policy.get(CONF_DEADBAND, 0),
+                    relative_deadband=policy.get(CONF_RELATIVE_DEADBAND, 0),
+                    keep_last=policy[CONF_KEEP_LAST],
+                )
+                for key, policy in sampling.items()
+            }
+        )
+        if sampling
+        else None
+    )
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -163,6 +205,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        state_sampler=state_sampler,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -177,6 +220,32 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return await instance.async_db_ready
 
 
+@callback
+def _async_reject_sampling_with_sum(
+    hass: HomeAssistant, sampling: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Remove the sampling policies of entities with a sum state class.
+
+    The sum of total and total_increasing entities is compiled from every
+    recorded state, so their states must not be sampled.
+    """
+    ent_reg = er.async_get(hass)
+    for key in list(sampling):
+        if (
+            (entry := ent_reg.async_get(key))
+            and entry.capabilities
+            and (state_class := entry.capabilities.get(ATTR_STATE_CLASS)) is not None
+            and state_class != SensorStateClass.MEASUREMENT
+        ):
+            _LOGGER.error(
+                "Sampling of %s is not supported since it has state class %s",
+                key,
+                state_class,
+            )
+            del sampling[key]
+    return sampling
+
+
 async def _async_setup_integration_platform(
     hass: HomeAssistant, instance: Recorder
 ) -> None:
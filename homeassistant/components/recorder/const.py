@@ -44,6 +44,9 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 
 DEFAULT_MAX_BIND_VARS = 4000
 
+# The amount of the database file sqlite reader connections memory map
+SQLITE_READER_MMAP_SIZE = 64 * 1024**2
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
@@ -54,6 +57,9 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# How often dropped states of sampled entities are checked for a flush
+SAMPLING_FLUSH_INTERVAL = 10
+
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
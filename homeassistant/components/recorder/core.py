@@ -17,8 +17,9 @@ from typing import TYPE_CHECKING, Any, cast
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
-from sqlalchemy.engine import Engine
-from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.engine.interfaces import CacheStats, DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
@@ -43,6 +44,7 @@ from homeassistant.helpers.event import (
     async_track_time_interval,
     async_track_utc_time_change,
 )
+from homeassistant.helpers.recorder import SESSION_INFO_READ_ONLY
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
@@ -61,6 +63,7 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SAMPLING_FLUSH_INTERVAL,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -80,6 +83,9 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
+from .sampling import StateSampler
+from .stage_timings import STAGE_COMMIT, STAGE_EVENT, STAGE_SERIALIZE, StageTimings
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -95,6 +101,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    FlushSampledStatesTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -116,6 +123,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_sqlite_reader_connection,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -132,6 +140,7 @@ SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
+FLUSH_SAMPLED_STATES_TASK = FlushSampledStatesTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
@@ -164,6 +173,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        state_sampler: StateSampler | None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -199,6 +209,8 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self.state_sampler = state_sampler
+        self.stage_timings = StageTimings()
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -219,6 +231,7 @@ class Recorder(threading.Thread):
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
+        self.purge_progress: PurgeProgress | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
@@ -226,6 +239,7 @@ class Recorder(threading.Thread):
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
+        self._sampling_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
@@ -339,6 +353,12 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self.queue_task(KEEP_ALIVE_TASK)
 
+    @callback
+    def _async_flush_sampled_states(self, now: datetime) -> None:
+        """Queue a flush of the dropped states of sampled entities."""
+        if self._event_listener and not self._database_lock_task:
+            self.queue_task(FLUSH_SAMPLED_STATES_TASK)
+
     @callback
     def _async_commit(self, now: datetime) -> None:
         """Queue a commit."""
@@ -418,6 +438,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._sampling_listener:
+            self._sampling_listener()
+            self._sampling_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -643,6 +666,16 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        # Record the dropped states of sampled entities once their
+        # min_interval has passed
+        if self.state_sampler:
+            self._sampling_listener = async_track_time_interval(
+                self.hass,
+                self._async_flush_sampled_states,
+                timedelta(seconds=SAMPLING_FLUSH_INTERVAL),
+                name="Recorder sampling flush",
+            )
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -1009,14 +1042,31 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
+        start = time.perf_counter()
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            if self.state_sampler is None:
+                self._process_state_changed_event_into_session(event)
+            else:
+                for sampled_event in self.state_sampler.events_to_record(event):
+                    self._process_state_changed_event_into_session(sampled_event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        self.stage_timings.add(STAGE_EVENT, time.perf_counter() - start)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _flush_sampled_states(self) -> None:
+        """Record the dropped states of sampled entities whose min_interval passed."""
+        if not self.enabled or self.state_sampler is None:
+            return
+        for event in self.state_sampler.expired_dropped_events(
+            dt_util.utcnow().timestamp()
+        ):
+            self._process_state_changed_event_into_session(event)
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1040,7 +1090,10 @@ class Recorder(threading.Thread):
             return
 
         event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+        start = time.perf_counter()
+        shared_data_bytes = event_data_manager.serialize_from_event(event)
+        self.stage_timings.add(STAGE_SERIALIZE, time.perf_counter() - start)
+        if not shared_data_bytes:
             return
 
         # Map the event data to the EventData table
@@ -1097,9 +1150,12 @@ class Recorder(threading.Thread):
         if states_meta_manager.active:
             dbstate.entity_id = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        if entity_id is None:
+            return
+        start = time.perf_counter()
+        shared_attrs_bytes = state_attributes_manager.serialize_from_event(event)
+        self.stage_timings.add(STAGE_SERIALIZE, time.perf_counter() - start)
+        if not shared_attrs_bytes:
             return
 
         # Map the entity_id to the StatesMeta table
@@ -1191,6 +1247,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.perf_counter()
 
         if (
             pending_last_reported
@@ -1208,6 +1265,7 @@ class Recorder(threading.Thread):
                     ],
                 )
         session.commit()
+        self.stage_timings.add(STAGE_COMMIT, time.perf_counter() - start)
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1360,6 +1418,49 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_WORKER_PREFIX
+        ):
+            setup_sqlite_reader_connection(dbapi_connection)
+
+    def _setup_sqlite_session_transaction(
+        self, session: Session, transaction: Any, connection: Connection
+    ) -> None:
+        """Make database executor connections query only for read only sessions.
+
+        Only the recorder thread should write, so a stray write from a
+        read only session on the database executor fails instead of
+        taking the write lock away from the recorder.
+        """
+        if not threading.current_thread().name.startswith(DB_WORKER_PREFIX):
+            return
+        read_only: bool = session.info.get(SESSION_INFO_READ_ONLY, False)
+        connection_info = connection.connection.info
+        if connection_info.get(SESSION_INFO_READ_ONLY, False) is read_only:
+            return
+        connection.exec_driver_sql(f"PRAGMA query_only={'ON' if read_only else 'OFF'}")
+        connection_info[SESSION_INFO_READ_ONLY] = read_only
+
+    def _count_statement_cache_hit(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: DefaultExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Count if the compiled form of a statement came from the cache.
+
+        Statements executed without compiling them, such as driver level
+        PRAGMAs, and statements that cannot be cached are not counted.
+        """
+        if context is None or context.compiled is None:
+            return
+        if (cache_hit := context.cache_hit) is CacheStats.CACHE_HIT:
+            self.stage_timings.add_statement(True)
+        elif cache_hit is CacheStats.CACHE_MISS:
+            self.stage_timings.add_statement(False)
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1406,10 +1507,18 @@ class Recorder(threading.Thread):
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
+        sqlalchemy_event.listen(
+            self.engine, "before_cursor_execute", self._count_statement_cache_hit
+        )
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
-        self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        session_maker = sessionmaker(bind=self.engine, future=True)
+        if self._using_file_sqlite:
+            sqlalchemy_event.listen(
+                session_maker, "after_begin", self._setup_sqlite_session_transaction
+            )
+        self._get_session = scoped_session(session_maker)
         _LOGGER.debug("Connected to recorder database")
 
     def _close_connection(self) -> None:
@@ -1435,6 +1544,14 @@ class Recorder(threading.Thread):
         """End the recorder session."""
         if self.event_session is None:
             return
+        if self.enabled and self.state_sampler:
+            # Record the states sampling dropped so the last state
+            # of sampled entities is not lost
+            try:
+                for event in self.state_sampler.pop_dropped_events():
+                    self._process_state_changed_event_into_session(event)
+            except Exception:
+                _LOGGER.exception("Error saving the sampled states during shutdown")
         if self.recorder_runs_manager.active:
             # .end will add to the event session
             self._event_session_has_pending_writes = True
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -17,6 +18,7 @@ from .modern import (
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states as _modern_iter_significant_states,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +30,7 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states",
     "state_changes_during_period",
 ]
 
@@ -152,6 +155,61 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_states: int | None = None,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield compressed significant states one entity at a time.
+
+    If max_states is set, the states of an entity are yielded in slices
+    of at most max_states states.
+    """
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        for entity_id, states in cast(
+            dict[str, list[dict[str, Any]]],
+            _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
+        ).items():
+            if max_states is None:
+                yield entity_id, states
+                continue
+            for idx in range(0, len(states), max_states):
+                yield entity_id, states[idx : idx + max_states]
+        return
+    yield from _modern_iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_states,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -37,7 +37,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..util import bucket_bind_list, execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -229,6 +229,101 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_states: int | None = None,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield compressed significant states one entity at a time.
+
+    Unlike get_significant_states the result is not collected into a
+    dict first, so callers can process the states of an entity while
+    the rows of the next ones are still being fetched from the database.
+
+    If max_states is set, the states of an entity are yielded in slices
+    of at most max_states states.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                stream_rows=True,
+            )
+        ):
+            return
+        rows, start_time_ts, entity_id_to_metadata_id = query
+        for entity_id, ent_results in _sorted_states_to_entity_lists(
+            rows,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            True,
+            no_attributes,
+            max_states,
+        ):
+            yield entity_id, cast(list[dict[str, Any]], ent_results)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream_rows: bool = False,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Execute the significant states query.
+
+    Returns the rows, the start time timestamp if start time states are
+    included and the metadata ids of the entities or None if none of the
+    entities have ever been recorded.
+
+    If stream_rows is set, rows of queries spanning more than a day are
+    fetched in batches instead of all at once.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +332,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -254,6 +349,10 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    metadata_ids = bucket_bind_list(metadata_ids)
+    metadata_ids_in_significant_domains = bucket_bind_list(
+        metadata_ids_in_significant_domains
+    )
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -275,14 +374,16 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            start_time if stream_rows else None,
+            end_time,
+            orm_rows=False,
+        ),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -692,6 +793,44 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, ent_results in _sorted_states_to_entity_lists(
+        states,
+        start_time_ts,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(ent_results)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_lists(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+    max_states: int | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into a list of states per entity.
+
+    States must be sorted by entity_id and last_updated. The states
+    of each entity are yielded as soon as its rows have been consumed.
+    If max_states is set, the states of an entity are yielded in slices
+    of at most max_states states while its rows are consumed.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -706,18 +845,13 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
     # Get the states at the start time
-    if len(entity_ids) == 1:
-        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
-        assert metadata_id is not None  # should not be possible if we got here
+    if len(metadata_id_to_entity_id) == 1:
+        metadata_id = next(iter(metadata_id_to_entity_id))
         states_iter: Iterable[tuple[int, Iterator[Row]]] = (
             (metadata_id, iter(states)),
         )
@@ -732,13 +866,13 @@ def _sorted_states_to_dict(
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        ent_results: list[State | dict[str, Any]]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
+            for rows in _row_batches(group, max_states, None):
+                if ent_results := [
                     state_class(
                         db_state,
                         attr_cache,
@@ -748,9 +882,9 @@ def _sorted_states_to_dict(
                         db_state[last_updated_ts_idx],
                         False,
                     )
-                    for db_state in group
-                ]
-            )
+                    for db_state in rows
+                ]:
+                    yield entity_id, ent_results
             continue
 
         prev_state: str | None = None
@@ -758,21 +892,24 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state = first_state[state_idx]
+        ent_results = [
+            state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
             )
+        ]
+        # The first state already takes one place in the first slice
+        row_batches = _row_batches(
+            group, max_states, max_states - 1 if max_states else None
+        )
 
         #
         # minimal_response only makes sense with last_updated == last_updated
@@ -783,36 +920,53 @@ def _sorted_states_to_dict(
         # changes so we can filter out duplicate states
         if compressed_state_format:
             # Compressed state format uses the timestamp directly
+            for rows in row_batches:
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in rows
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+                if ent_results:
+                    yield entity_id, ent_results
+                    ent_results = []
+            continue
+
+        # Non-compressed state format returns an ISO formatted string
+        _utc_from_timestamp = dt_util.utc_from_timestamp
+        for rows in row_batches:
             ent_results.extend(
                 [
                     {
                         attr_state: (prev_state := state),
-                        attr_time: row[last_updated_ts_idx],
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
                     }
-                    for row in group
+                    for row in rows
                     if (state := row[state_idx]) != prev_state
                 ]
             )
-            continue
+            if ent_results:
+                yield entity_id, ent_results
+                ent_results = []
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
-        )
 
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
+def _row_batches(
+    rows: Iterator[Row], max_rows: int | None, first_batch_rows: int | None
+) -> Iterator[Iterable[Row]]:
+    """Split the rows of an entity into batches of at most max_rows rows.
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+    If first_batch_rows is set, the first batch is limited to that many rows.
+    Without max_rows all rows are returned as a single batch.
+    """
+    if max_rows is None:
+        yield rows
+        return
+    if first_batch_rows is not None:
+        yield tuple(islice(rows, first_batch_rows))
+    yield from batched(rows, max_rows)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -28,7 +29,8 @@ from .queries import (
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
-    delete_statistics_short_term_rows,
+    delete_statistics_short_term_rows_before,
+    delete_statistics_short_term_rows_until,
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
@@ -37,7 +39,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
-    find_short_term_statistics_to_purge,
+    find_short_term_statistics_purge_boundary,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -53,6 +55,43 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# When the recorder backlog is above this, a purge pass only deletes a
+# single batch so the queued events are not held up behind the purge
+PURGE_THROTTLE_BACKLOG = 1000
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of a purge that runs over multiple passes."""
+
+    purge_before: datetime
+    passes: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    throttled_passes: int = 0
+    duration: float = 0.0
+    finished: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of states and events purged per second."""
+        if not self.duration:
+            return 0.0
+        return (self.states_purged + self.events_purged) / self.duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "passes": self.passes,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "throttled_passes": self.throttled_passes,
+            "duration": self.duration,
+            "rows_per_second": self.rows_per_second,
+            "finished": self.finished,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,6 +101,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -87,25 +127,23 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+        has_more_to_purge |= _purge_short_term_statistics(
+            session, purge_before, instance.max_bind_vars
+        )
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if has_more_to_purge or statistics_runs:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -178,6 +216,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +240,8 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress:
+            progress.states_purged += len(state_ids)
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +256,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,6 +278,8 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress:
+            progress.events_purged += len(event_ids)
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -443,17 +487,6 @@ def _select_statistics_runs_to_purge(
     return statistic_runs_list
 
 
-def _select_short_term_statistics_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
-) -> list[int]:
-    """Return a list of short term statistics to purge."""
-    statistics = session.execute(
-        find_short_term_statistics_to_purge(purge_before, max_bind_vars)
-    ).all()
-    _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
-    return [statistic_id for (statistic_id,) in statistics]
-
-
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -561,13 +594,32 @@ def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None
 
 
 def _purge_short_term_statistics(
-    session: Session, short_term_statistics: list[int]
-) -> None:
-    """Delete by id."""
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> bool:
+    """Delete short term statistics by start time range.
+
+    Nothing references short term statistics rows, so instead of selecting
+    the ids to delete we delete a contiguous range of the start_ts index.
+    The range covers at least max_bind_vars rows, extended to the end of the
+    5-minute period it ends in. Returns True if there may be more to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    boundary_ts = session.execute(
+        find_short_term_statistics_purge_boundary(purge_before_ts, max_bind_vars)
+    ).scalar()
+    if boundary_ts is None:
+        deleted_rows = session.execute(
+            delete_statistics_short_term_rows_before(purge_before_ts)
+        ).rowcount
+        _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+        return False
     deleted_rows = session.execute(
-        delete_statistics_short_term_rows(short_term_statistics)
+        delete_statistics_short_term_rows_until(boundary_ts)
+    ).rowcount
+    _LOGGER.debug(
+        "Deleted %s short term statistics up to %s", deleted_rows, boundary_ts
     )
-    _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+    return True
 
 
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
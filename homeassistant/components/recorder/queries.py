@@ -580,13 +580,24 @@ def delete_statistics_runs_rows(
     )
 
 
-def delete_statistics_short_term_rows(
-    short_term_statistics: Iterable[int],
+def delete_statistics_short_term_rows_before(
+    purge_before_ts: float,
 ) -> StatementLambdaElement:
-    """Delete statistics_short_term rows."""
+    """Delete statistics_short_term rows older than purge_before_ts."""
     return lambda_stmt(
         lambda: delete(StatisticsShortTerm)
-        .where(StatisticsShortTerm.id.in_(short_term_statistics))
+        .where(StatisticsShortTerm.start_ts < purge_before_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_statistics_short_term_rows_until(
+    boundary_ts: float,
+) -> StatementLambdaElement:
+    """Delete statistics_short_term rows up to and including boundary_ts."""
+    return lambda_stmt(
+        lambda: delete(StatisticsShortTerm)
+        .where(StatisticsShortTerm.start_ts <= boundary_ts)
         .execution_options(synchronize_session=False)
     )
 
@@ -636,15 +647,16 @@ def find_states_to_purge(
     )
 
 
-def find_short_term_statistics_to_purge(
-    purge_before: datetime, max_bind_vars: int
+def find_short_term_statistics_purge_boundary(
+    purge_before_ts: float, max_bind_vars: int
 ) -> StatementLambdaElement:
-    """Find short term statistics to purge."""
-    purge_before_ts = purge_before.timestamp()
+    """Find the start of the last short term statistics row in a purge batch."""
     return lambda_stmt(
-        lambda: select(StatisticsShortTerm.id)
+        lambda: select(StatisticsShortTerm.start_ts)
         .filter(StatisticsShortTerm.start_ts < purge_before_ts)
-        .limit(max_bind_vars)
+        .order_by(StatisticsShortTerm.start_ts)
+        .offset(max_bind_vars - 1)
+        .limit(1)
     )
 
 
@@ -0,0 +1,339 @@
+"""Sample state changes of noisy entities before they are recorded."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import math
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorStateClass
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, EventStateChangedData, State, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from .db_schema import StatisticsShortTerm
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_PERIOD = StatisticsShortTerm.duration.total_seconds()
+# The number of finished statistics periods kept for each measurement
+STATISTICS_PERIODS_KEPT = 12
+
+
+@dataclass(slots=True, frozen=True)
+class SamplingPolicy:
+    """Recording policy of an entity or a domain.
+
+    min_interval: seconds that must pass since the last recorded state.
+    deadband: minimum absolute change of a numeric state.
+    relative_deadband: minimum change of a numeric state relative to the
+    last recorded value.
+    keep_last: record the last dropped state right before the next
+    recorded state, or once min_interval has passed, so step changes keep
+    their shape.
+    """
+
+    min_interval: float = 0
+    deadband: float = 0
+    relative_deadband: float = 0
+    keep_last: bool = False
+
+
+@dataclass(slots=True)
+class _RecordedState:
+    """The last recorded state of a sampled entity."""
+
+    timestamp: float
+    value: float | None
+    dropped: Event[EventStateChangedData] | None = None
+
+
+@dataclass(slots=True)
+class _MeasurementPeriod:
+    """Running min, max and time weighted mean of a measurement.
+
+    The values are tracked for a single short term statistics period,
+    including the states that were not recorded.
+    """
+
+    start: float
+    # When the first value of the period took effect, the start of the
+    # period if the value at the start of the period is known
+    first: float
+    # When the current value took effect
+    last: float
+    value: float
+    min: float
+    max: float
+    # The latest state, its attributes are used when compiling statistics
+    state: State
+    # The integral of the values from first until last
+    integral: float = 0
+    mixed_units: bool = False
+
+    def add(self, timestamp: float, value: float, state: State) -> None:
+        """Add a value that took effect at timestamp."""
+        self.integral += self.value * (timestamp - self.last)
+        self.last = timestamp
+        self.value = value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) != self.state.attributes.get(
+            ATTR_UNIT_OF_MEASUREMENT
+        ):
+            self.mixed_units = True
+        self.state = state
+
+    def next_period(self, start: float) -> _MeasurementPeriod:
+        """Return a period starting at start with the current value."""
+        return _MeasurementPeriod(
+            start, start, start, self.value, self.value, self.value, self.state
+        )
+
+    def statistics_states(self, end: float) -> list[State]:
+        """Return states with the min, max and time weighted mean of the period.
+
+        The states all take effect at the start of the period, with the
+        mean being the last one, so the sensor statistics compiler derives
+        the same min, max and mean from them.
+        """
+        mean = (self.integral + self.value * (end - self.last)) / (end - self.first)
+        start = dt_util.utc_from_timestamp(self.start)
+        return [
+            State(
+                self.state.entity_id,
+                str(value),
+                self.state.attributes,
+                last_changed=start,
+                last_reported=start,
+                last_updated=start,
+                validate_entity_id=False,
+            )
+            for value in (self.min, self.max, mean)
+        ]
+
+
+@dataclass(slots=True)
+class _MeasurementStatistics:
+    """Running statistics of a sampled measurement."""
+
+    current: _MeasurementPeriod
+    finished: dict[float, _MeasurementPeriod] = field(default_factory=dict)
+
+
+def _period_start(timestamp: float) -> float:
+    """Return the start of the statistics period containing timestamp."""
+    return timestamp - timestamp % STATISTICS_PERIOD
+
+
+def _numeric_value(state: str) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class StateSampler:
+    """Decide which state changes of sampled entities are recorded.
+
+    Policies are keyed by entity_id or domain, an entity_id policy takes
+    precedence. Statistics are compiled from the recorded states, so the
+    min, max and mean of sampled measurements are tracked here from every
+    state instead. Entities with a state class that has a sum are never
+    sampled. This class is only used from the recorder thread.
+    """
+
+    def __init__(self, policies: dict[str, SamplingPolicy]) -> None:
+        """Initialize the sampler."""
+        self._policies = policies
+        self._entity_policies: dict[str, SamplingPolicy | None] = {}
+        self._recorded: dict[str, _RecordedState] = {}
+        self._measurements: dict[str, _MeasurementStatistics] = {}
+
+    def _policy(self, entity_id: str) -> SamplingPolicy | None:
+        """Return the policy of an entity."""
+        try:
+            return self._entity_policies[entity_id]
+        except KeyError:
+            policy = self._policies.get(entity_id) or self._policies.get(
+                split_entity_id(entity_id)[0]
+            )
+            self._entity_policies[entity_id] = policy
+            return policy
+
+    def events_to_record(
+        self, event: Event[EventStateChangedData]
+    ) -> list[Event[EventStateChangedData]]:
+        """Return the state changed events to record for an event."""
+        entity_id = event.data["entity_id"]
+        if (policy := self._policy(entity_id)) is None:
+            return [event]
+        if (new_state := event.data["new_state"]) is None:
+            return [*self._forget(entity_id), event]
+        state_class = new_state.attributes.get(ATTR_STATE_CLASS)
+        if state_class is not None and state_class != SensorStateClass.MEASUREMENT:
+            _LOGGER.warning(
+                "Not sampling %s since the sum of its state class %s is "
+                "compiled from the recorded states",
+                entity_id,
+                state_class,
+            )
+            self._entity_policies[entity_id] = None
+            return [*self._forget(entity_id), event]
+        timestamp = new_state.last_updated_timestamp
+        value = _numeric_value(new_state.state)
+        if state_class is None:
+            self._measurements.pop(entity_id, None)
+        elif value is not None:
+            self._add_measurement(event, timestamp, value)
+        recorded = self._recorded.get(entity_id)
+        if (
+            recorded is not None
+            and (old_state := event.data["old_state"]) is not None
+            # Attribute only changes are always recorded
+            and old_state.state != new_state.state
+            and not _is_significant(policy, recorded, timestamp, value)
+        ):
+            if policy.keep_last:
+                recorded.dropped = event
+            return []
+        self._recorded[entity_id] = _RecordedState(timestamp, value)
+        if recorded is not None and recorded.dropped is not None:
+            return [recorded.dropped, event]
+        return [event]
+
+    def _add_measurement(
+        self, event: Event[EventStateChangedData], timestamp: float, value: float
+    ) -> None:
+        """Add a value of a measurement to its running statistics."""
+        new_state = event.data["new_state"]
+        assert new_state is not None
+        entity_id = new_state.entity_id
+        if (measurement := self._measurements.get(entity_id)) is None:
+            start = _period_start(timestamp)
+            current = _MeasurementPeriod(
+                start, timestamp, timestamp, value, value, value, new_state
+            )
+            if (
+                (old_state := event.data["old_state"]) is not None
+                and old_state.last_updated_timestamp <= start
+                and (old_value := _numeric_value(old_state.state)) is not None
+            ):
+                # The value at the start of the period is known
+                current = _MeasurementPeriod(
+                    start, start, start, old_value, old_value, old_value, old_state
+                )
+                current.add(timestamp, value, new_state)
+            self._measurements[entity_id] = _MeasurementStatistics(current)
+            return
+        current = measurement.current
+        if timestamp >= current.start + STATISTICS_PERIOD:
+            finished = measurement.finished
+            finished[current.start] = current
+            start = _period_start(timestamp)
+            # Periods without a change keep the value they started with
+            skipped = max(
+                current.start + STATISTICS_PERIOD,
+                start - STATISTICS_PERIODS_KEPT * STATISTICS_PERIOD,
+            )
+            while skipped < start:
+                finished[skipped] = current.next_period(skipped)
+                skipped += STATISTICS_PERIOD
+            for expired in [
+                period_start
+                for period_start in finished
+                if period_start < start - STATISTICS_PERIODS_KEPT * STATISTICS_PERIOD
+            ]:
+                del finished[expired]
+            current = measurement.current = current.next_period(start)
+        current.add(timestamp, value, new_state)
+
+    def statistics_states(
+        self, entity_id: str, start: datetime, end: datetime
+    ) -> list[State] | None:
+        """Return states to compile the statistics of a sampled measurement from.
+
+        The states give the min, max and time weighted mean of every state
+        of the entity during the period, including the states that were
+        not recorded. None is returned when they are not known, for example
+        for the period the recorder started in, and the statistics should
+        be compiled from the recorded states.
+        """
+        if (measurement := self._measurements.get(entity_id)) is None:
+            return None
+        start_ts = start.timestamp()
+        current = measurement.current
+        if current.start == start_ts:
+            period: _MeasurementPeriod | None = current
+        elif current.start < start_ts:
+            # There was no change since the current period
+            period = current.next_period(start_ts)
+        else:
+            period = measurement.finished.get(start_ts)
+        if period is None or period.first != period.start or period.mixed_units:
+            return None
+        return period.statistics_states(end.timestamp())
+
+    def expired_dropped_events(
+        self, timestamp: float
+    ) -> list[Event[EventStateChangedData]]:
+        """Return the dropped states whose min_interval has passed.
+
+        The returned states become the last recorded state of their entity.
+        """
+        events: list[Event[EventStateChangedData]] = []
+        for entity_id, recorded in self._recorded.items():
+            if (
+                (dropped := recorded.dropped) is None
+                or (policy := self._entity_policies[entity_id]) is None
+                or timestamp - recorded.timestamp < policy.min_interval
+            ):
+                continue
+            new_state = dropped.data["new_state"]
+            assert new_state is not None
+            self._recorded[entity_id] = _RecordedState(
+                new_state.last_updated_timestamp, _numeric_value(new_state.state)
+            )
+            events.append(dropped)
+        return events
+
+    def pop_dropped_events(self) -> list[Event[EventStateChangedData]]:
+        """Return all dropped states and forget the recorded states."""
+        events = [
+            recorded.dropped
+            for recorded in self._recorded.values()
+            if recorded.dropped is not None
+        ]
+        self._recorded.clear()
+        return events
+
+    def _forget(self, entity_id: str) -> list[Event[EventStateChangedData]]:
+        """Forget the recorded state of an entity and return its dropped state."""
+        self._measurements.pop(entity_id, None)
+        if (recorded := self._recorded.pop(entity_id, None)) is None or (
+            recorded.dropped is None
+        ):
+            return []
+        return [recorded.dropped]
+
+
+def _is_significant(
+    policy: SamplingPolicy,
+    recorded: _RecordedState,
+    timestamp: float,
+    value: float | None,
+) -> bool:
+    """Return if a state differs enough from the last recorded state."""
+    if value is None or (recorded_value := recorded.value) is None:
+        # Transitions to or from non-numeric states such as unavailable
+        # or unknown are always recorded
+        return True
+    if timestamp - recorded.timestamp < policy.min_interval:
+        return False
+    delta = abs(value - recorded_value)
+    if delta < policy.deadband:
+        return False
+    return delta >= abs(recorded_value) * policy.relative_deadband
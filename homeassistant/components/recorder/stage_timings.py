@@ -0,0 +1,126 @@
+"""Track how much time the recorder spends in each stage of its work."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+
+# Processing a single event into the session, excluding the commit
+STAGE_EVENT = "event"
+# Serializing state attributes and event data
+STAGE_SERIALIZE = "serialize"
+# Table manager lookups that had to query the database
+STAGE_LOOKUP = "lookup"
+# Flushing and committing the event session
+STAGE_COMMIT = "commit"
+STAGE_STATISTICS = "statistics"
+STAGE_PURGE = "purge"
+
+STAGES = (
+    STAGE_EVENT,
+    STAGE_SERIALIZE,
+    STAGE_LOOKUP,
+    STAGE_COMMIT,
+    STAGE_STATISTICS,
+    STAGE_PURGE,
+)
+
+# Upper bounds of the histogram buckets in seconds
+TIMING_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+@dataclass(slots=True)
+class StageTiming:
+    """Timing histogram of a single stage."""
+
+    total: float = 0
+    max: float = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(TIMING_BUCKETS) + 1))
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a single run of the stage.
+
+        This is called for every event so it is kept as cheap as possible,
+        the count is derived from the histogram when needed.
+        """
+        self.total += duration
+        self.max = max(duration, self.max)
+        self.buckets[bisect_left(TIMING_BUCKETS, duration)] += 1
+
+    def as_dict(self, elapsed: float) -> dict[str, Any]:
+        """Return the timing as a dict."""
+        count = sum(self.buckets)
+        return {
+            "count": count,
+            "per_second": count / elapsed if elapsed else 0,
+            "total": self.total,
+            "mean": self.total / count if count else 0,
+            "max": self.max,
+            "histogram": [
+                {"le": le, "count": count}
+                for le, count in zip((*TIMING_BUCKETS, None), self.buckets, strict=True)
+            ],
+        }
+
+
+class StageTimings:
+    """Timing histograms of all recorder stages.
+
+    Timings are added from the recorder thread and the database executor
+    threads, and read from the event loop. Reads may be slightly out of
+    date, which is fine for diagnostics.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_stages",
+        "_started",
+        "statement_cache_hits",
+        "statement_cache_misses",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the stage timings."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add(self, stage: str, duration: float) -> None:
+        """Add the duration of a single run of a stage."""
+        with self._lock:
+            self._stages[stage].add(duration)
+
+    def add_statement(self, cache_hit: bool) -> None:
+        """Count a statement that was or was not found in the compiled cache."""
+        with self._lock:
+            if cache_hit:
+                self.statement_cache_hits += 1
+            else:
+                self.statement_cache_misses += 1
+
+    def reset(self) -> None:
+        """Reset all timings."""
+        with self._lock:
+            self._stages = {stage: StageTiming() for stage in STAGES}
+            self._started = time.monotonic()
+            self.statement_cache_hits = 0
+            self.statement_cache_misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings of all stages as a dict."""
+        elapsed = time.monotonic() - self._started
+        hits = self.statement_cache_hits
+        statements = hits + self.statement_cache_misses
+        return {
+            "elapsed": elapsed,
+            "stages": {
+                stage: timing.as_dict(elapsed) for stage, timing in self._stages.items()
+            },
+            "statement_cache": {
+                "hits": hits,
+                "misses": self.statement_cache_misses,
+                "hit_rate": hits / statements if statements else 0,
+            },
+        }
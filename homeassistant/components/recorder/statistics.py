@@ -73,6 +73,7 @@ from .models import (
     process_timestamp,
 )
 from .util import (
+    bucket_bind_list,
     execute,
     execute_stmt_lambda_element,
     filter_unique_constraint_integrity_error,
@@ -1136,6 +1137,7 @@ def _generate_statistics_during_period_stmt(
         end_time_ts = end_time.timestamp()
         stmt += lambda q: q.filter(table.start_ts < end_time_ts)
     if metadata_ids:
+        metadata_ids = bucket_bind_list(metadata_ids)
         stmt += lambda q: q.filter(table.metadata_id.in_(metadata_ids))
     stmt += lambda q: q.order_by(table.metadata_id, table.start_ts)
     return stmt
@@ -2031,6 +2033,7 @@ def _generate_statistics_at_time_stmt(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     """Create the statement for finding the statistics for a given time."""
+    bucketed_metadata_ids = bucket_bind_list(list(metadata_ids))
     stmt = _generate_select_columns_for_types_stmt(table, types)
     stmt += lambda q: q.join(
         (
@@ -2040,7 +2043,7 @@ def _generate_statistics_at_time_stmt(
                     table.metadata_id.label("max_metadata_id"),
                 )
                 .filter(table.start_ts < start_time_ts)
-                .filter(table.metadata_id.in_(metadata_ids))
+                .filter(table.metadata_id.in_(bucketed_metadata_ids))
                 .group_by(table.metadata_id)
                 .subquery()
             )
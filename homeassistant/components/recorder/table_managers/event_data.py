@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
+import time
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
@@ -14,6 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
+from ..stage_timings import STAGE_LOOKUP
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -94,6 +96,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        start = time.perf_counter()
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
                 for data_id, shared_data in execute_stmt_lambda_element(
@@ -103,6 +106,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
                         int, data_id
                     )
 
+        self.recorder.stage_timings.add(STAGE_LOOKUP, time.perf_counter() - start)
         return results
 
     def add_pending(self, db_event_data: EventData) -> None:
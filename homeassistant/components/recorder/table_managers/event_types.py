@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 from lru import LRU
@@ -14,6 +15,7 @@ from homeassistant.util.event_type import EventType
 
 from ..db_schema import EventTypes
 from ..queries import find_event_type_ids
+from ..stage_timings import STAGE_LOOKUP
 from ..tasks import RefreshEventTypesTask
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -89,6 +91,7 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
         if not missing:
             return results
 
+        start = time.perf_counter()
         with session.no_autoflush:
             for missing_chunk in chunked_or_all(missing, self.recorder.max_bind_vars):
                 for event_type_id, event_type in execute_stmt_lambda_element(
@@ -98,6 +101,8 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
                         int, event_type_id
                     )
 
+        self.recorder.stage_timings.add(STAGE_LOOKUP, time.perf_counter() - start)
+
         if non_existent := [
             event_type for event_type in missing if results[event_type] is None
         ]:
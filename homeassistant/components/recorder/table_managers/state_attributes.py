@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+import time
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -14,6 +16,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
+from ..stage_timings import STAGE_LOOKUP
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -37,11 +40,35 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The state machine reuses the attributes object of the old
+        # state when the attributes did not change, so we keep the
+        # serialized attributes of the last state of each entity
+        # to avoid serializing the same attributes again.
+        self._last_serialized: LRU[str, tuple[Mapping[str, Any], bytes]] = LRU(
+            CACHE_SIZE
+        )
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache sizes.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        lru = self._last_serialized
+        if new_size > lru.get_size():
+            lru.set_size(new_size)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        if (new_state := event.data["new_state"]) is None:
+            self._last_serialized.pop(event.data["entity_id"], None)
+        elif (
+            last_serialized := self._last_serialized.get(new_state.entity_id)
+        ) and last_serialized[0] is new_state.attributes:
+            return last_serialized[1]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +78,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if new_state is not None:
+            self._last_serialized[new_state.entity_id] = (
+                new_state.attributes,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -105,6 +138,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        start = time.perf_counter()
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
@@ -114,6 +148,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                         int, attributes_id
                     )
 
+        self.recorder.stage_timings.add(STAGE_LOOKUP, time.perf_counter() - start)
         return results
 
     def add_pending(self, db_state_attributes: StateAttributes) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+import time
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
@@ -12,7 +13,8 @@ from homeassistant.util.collection import chunked_or_all
 
 from ..db_schema import StatesMeta
 from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
-from ..util import execute_stmt_lambda_element
+from ..stage_timings import STAGE_LOOKUP
+from ..util import bucket_bind_list, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
@@ -108,10 +110,11 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         # thread (history query).
         update_cache = from_recorder or not self._did_first_load
 
+        start = time.perf_counter()
         with session.no_autoflush:
             for missing_chunk in chunked_or_all(missing, self.recorder.max_bind_vars):
                 for metadata_id, entity_id in execute_stmt_lambda_element(
-                    session, find_states_metadata_ids(missing_chunk)
+                    session, find_states_metadata_ids(bucket_bind_list(missing_chunk))
                 ):
                     metadata_id = cast(int, metadata_id)
                     results[entity_id] = metadata_id
@@ -119,6 +122,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
                     if update_cache:
                         self._id_map[entity_id] = metadata_id
 
+        self.recorder.stage_timings.add(STAGE_LOOKUP, time.perf_counter() - start)
         return results
 
     def add_pending(self, db_states_meta: StatesMeta) -> None:
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
@@ -18,6 +19,7 @@ from . import entity_registry, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
+from .stage_timings import STAGE_PURGE, STAGE_STATISTICS
 from .util import periodic_db_cleanups, session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -117,9 +119,35 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished
+            or progress.purge_before != self.purge_before
         ):
+            progress = instance.purge_progress = purge.PurgeProgress(self.purge_before)
+        events_batch_size = purge.DEFAULT_EVENTS_BATCHES_PER_PURGE
+        states_batch_size = purge.DEFAULT_STATES_BATCHES_PER_PURGE
+        if instance.backlog > purge.PURGE_THROTTLE_BACKLOG:
+            # Give the recorder a chance to catch up between smaller passes
+            events_batch_size = states_batch_size = 1
+            progress.throttled_passes += 1
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            events_batch_size,
+            states_batch_size,
+            progress,
+        )
+        duration = time.monotonic() - start
+        progress.passes += 1
+        progress.duration += duration
+        instance.stage_timings.add(STAGE_PURGE, duration)
+        if finished:
+            progress.finished = True
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -169,7 +197,10 @@ class StatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
-        if statistics.compile_statistics(instance, self.start, self.fire_events):
+        start = time.perf_counter()
+        finished = statistics.compile_statistics(instance, self.start, self.fire_events)
+        instance.stage_timings.add(STAGE_STATISTICS, time.perf_counter() - start)
+        if finished:
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
@@ -181,7 +212,10 @@ class CompileMissingStatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
-        if statistics.compile_missing_statistics(instance):
+        start = time.perf_counter()
+        finished = statistics.compile_missing_statistics(instance)
+        instance.stage_timings.add(STAGE_STATISTICS, time.perf_counter() - start)
+        if finished:
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(CompileMissingStatisticsTask())
@@ -297,6 +331,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class FlushSampledStatesTask(RecorderTask):
+    """Record the dropped states of sampled entities whose min_interval passed."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._flush_sampled_states()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
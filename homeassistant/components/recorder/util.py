@@ -41,6 +41,7 @@ from .const import (
     DOMAIN,
     SQLITE_MAX_BIND_VARS,
     SQLITE_MODERN_MAX_BIND_VARS,
+    SQLITE_READER_MMAP_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -70,6 +71,9 @@ QUERY_RETRY_WAIT = 0.1
 SQLITE3_POSTFIXES = ["", "-wal", "-shm"]
 DEFAULT_YIELD_STATES_ROWS = 32768
 
+# Bind lists up to this length are padded to the next power of two
+MAX_BUCKETED_BIND_LIST = 256
+
 
 # Our minimum versions for each database
 #
@@ -208,6 +212,22 @@ def execute_stmt_lambda_element(
     raise RuntimeError  # pragma: no cover
 
 
+def bucket_bind_list[_T](values: list[_T]) -> list[_T]:
+    """Pad a list of values for an IN clause to a power of two length.
+
+    Every distinct length of an IN list renders a distinct SQL string,
+    which misses the prepared statement cache of the database driver.
+    Repeating the last value does not change the result of the IN clause
+    and keeps the number of distinct statements small.
+    """
+    length = len(values)
+    if length > MAX_BUCKETED_BIND_LIST or not length:
+        return values
+    if (missing := (1 << (length - 1).bit_length()) - length) == 0:
+        return values
+    return [*values, *(values[-1],) * missing]
+
+
 def validate_or_move_away_sqlite_database(dburl: str) -> bool:
     """Ensure that the database is valid or move it away."""
     dbpath = dburl_to_path(dburl)
@@ -493,6 +513,17 @@ def async_create_backup_failure_issue(
     )
 
 
+def setup_sqlite_reader_connection(dbapi_connection: DBAPIConnection) -> None:
+    """Execute statements needed for a sqlite database executor connection.
+
+    The connections memory map the database file to avoid copying pages
+    into the page cache of every reader.
+    """
+    execute_on_connection(
+        dbapi_connection, f"PRAGMA mmap_size={SQLITE_READER_MMAP_SIZE}"
+    )
+
+
 def setup_connection_for_dialect(
     instance: Recorder,
     dialect_name: str,
@@ -89,6 +89,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
+    websocket_api.async_register_command(hass, ws_stage_timings)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
@@ -320,6 +321,27 @@ async def ws_update_statistics_issues(
     connection.send_result(msg["id"])
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/stage_timings",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@callback
+def ws_stage_timings(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return how much time the recorder spent in each stage."""
+    instance = get_instance(hass)
+    stage_timings = instance.stage_timings
+    connection.send_result(
+        msg["id"], stage_timings.as_dict() | {"backlog": instance.backlog}
+    )
+    if msg["reset"]:
+        stage_timings.reset()
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -441,6 +441,16 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+        # Sampled measurements are not recorded at full resolution, the
+        # recorder tracks their statistics from every state instead
+        if (state_sampler := get_instance(hass).state_sampler) is not None:
+            for entity_id in entities_significant_history:
+                if (
+                    sampled_states := state_sampler.statistics_states(
+                        entity_id, start, end
+                    )
+                ) is not None:
+                    history_list[entity_id] = sampled_states
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
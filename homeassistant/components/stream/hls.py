@@ -64,6 +64,9 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The rendered playlist is shared by all requests until the last
+        # segment changes, keyed by its sequence, parts and completeness
+        self.rendered_playlist: tuple[tuple[int, int, bool], bytes] | None = None
 
     @property
     def name(self) -> str:
@@ -74,6 +77,7 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self.rendered_playlist = None
 
     @property
     def target_duration(self) -> float:
@@ -232,6 +236,22 @@ class HlsPlaylistView(StreamView):
 
         return "\n".join(playlist) + "\n"
 
+    @classmethod
+    def render_cached(cls, track: HlsStreamOutput) -> bytes:
+        """Render the HLS playlist file once for each state of the last segment.
+
+        Blocking requests for the same part are released together and
+        share a single render.
+        """
+        last_segment = track.last_segment
+        assert last_segment is not None
+        key = (last_segment.sequence, len(last_segment.parts), last_segment.complete)
+        if (rendered := track.rendered_playlist) is not None and rendered[0] == key:
+            return rendered[1]
+        playlist = cls.render(track).encode("utf-8")
+        track.rendered_playlist = (key, playlist)
+        return playlist
+
     @staticmethod
     def bad_request(blocking: bool, target_duration: float) -> web.Response:
         """Return a HTTP Bad Request response."""
@@ -325,7 +345,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render_cached(track),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -50,6 +50,7 @@ from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
     json_bytes,
+    json_bytes_array,
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
@@ -67,6 +68,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ALL_STATES_JSON_CACHE = "websocket_api_all_states_json"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +86,7 @@ def async_register_commands(
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_http_metrics)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
@@ -309,12 +312,17 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_states(connection: ActiveConnection) -> bool:
+    user = connection.user
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -330,6 +338,17 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    generation = hass.states.generation
+    can_read_all_states = _async_can_read_all_states(connection)
+    if (
+        can_read_all_states
+        and (cached := hass.data.get(ALL_STATES_JSON_CACHE)) is not None
+        and cached[0] == generation
+    ):
+        # No state changed since the payload was cached
+        connection.send_message(construct_result_message(msg["id"], cached[1]))
+        return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -337,7 +356,10 @@ def handle_get_states(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
+        json_payload = json_bytes_array(serialized_states)
+        if can_read_all_states:
+            hass.data[ALL_STATES_JSON_CACHE] = (generation, json_payload)
+        connection.send_message(construct_result_message(msg["id"], json_payload))
         return
 
     # If we can't serialize, we'll filter out unserializable states
@@ -361,9 +383,7 @@ def _send_handle_get_states_response(
 ) -> None:
     """Send handle get states response."""
     connection.send_message(
-        construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
-        )
+        construct_result_message(msg_id, json_bytes_array(serialized_states))
     )
 
 
@@ -570,6 +590,28 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "http/metrics",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@decorators.require_admin
+def handle_http_metrics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle HTTP metrics command."""
+    if (metrics := hass.http.metrics) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_SUPPORTED, "HTTP metrics are not enabled"
+        )
+        return
+    connection.send_result(msg["id"], metrics.as_dict())
+    if msg["reset"]:
+        metrics.reset()
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
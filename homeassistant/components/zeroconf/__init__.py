@@ -13,6 +13,7 @@ import re
 import sys
 from typing import TYPE_CHECKING, Any, Final, cast
 
+from lru import LRU
 import voluptuous as vol
 from zeroconf import (
     BadTypeInNameException,
@@ -78,6 +79,9 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# Number of records that did not match any integration to remember
+MAX_NOT_MATCHED_RECORDS = 2048
+
 ATTR_DOMAIN: Final = "domain"
 ATTR_NAME: Final = "name"
 ATTR_PROPERTIES: Final = "properties"
@@ -364,6 +368,10 @@ class ZeroconfDiscovery:
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
+        # TXT record data of records that did not match any integration.
+        # Matching only depends on the name and the properties so a
+        # record is not matched again until its properties change.
+        self._not_matched: LRU[tuple[str, str], bytes] = LRU(MAX_NOT_MATCHED_RECORDS)
 
     async def async_setup(self) -> None:
         """Start discovery."""
@@ -431,6 +439,7 @@ class ZeroconfDiscovery:
         )
 
         if state_change is ServiceStateChange.Removed:
+            self._not_matched.pop((service_type, name), None)
             self._async_dismiss_discoveries(name)
             return
 
@@ -478,6 +487,11 @@ class ZeroconfDiscovery:
         self, async_service_info: AsyncServiceInfo, service_type: str, name: str
     ) -> None:
         """Process a zeroconf update."""
+        record_key = (service_type, name)
+        if (
+            text := self._not_matched.get(record_key)
+        ) is not None and text == async_service_info.text:
+            return
         info = info_from_service(async_service_info)
         if not info:
             # Prevent the browser thread from collapsing
@@ -523,12 +537,10 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
-            return
-
+        matched = domain is not None
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in matchers:
+        for matcher in self.zeroconf_types.get(service_type, ()):
             if len(matcher) > 1:
                 if ATTR_NAME in matcher and not _memorized_fnmatch(
                     info.name.lower(), matcher[ATTR_NAME]
@@ -557,6 +569,10 @@ class ZeroconfDiscovery:
                 info,
                 discovery_key=discovery_key,
             )
+            matched = True
+
+        if not matched and (text := async_service_info.text) is not None:
+            self._not_matched[record_key] = text
 
 
 def async_get_homekit_discovery(
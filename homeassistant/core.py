@@ -2076,7 +2076,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_generation",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2087,6 +2094,15 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return a counter that changes whenever a state is changed or removed.
+
+        Only reporting an unchanged state does not change the counter.
+        """
+        return self._generation
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2199,6 +2215,7 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._generation += 1
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2385,6 +2402,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._generation += 1
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
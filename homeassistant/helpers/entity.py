@@ -521,6 +521,9 @@ class Entity(
 
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
+    # Last friendly name derived from the device entry, as a tuple of
+    # (device entry, entity name, friendly name)
+    __device_friendly_name: tuple[dr.DeviceEntry, str | None, str | None] | None = None
     __remove_future: asyncio.Future[None] | None = None
 
     # Entity Properties
@@ -1034,10 +1037,22 @@ class Entity(
         if not self.has_entity_name or not (device_entry := self.device_entry):
             return name
 
-        device_name = device_entry.name_by_user or device_entry.name
         if name is None and self.use_device_name:
-            return device_name
-        return f"{device_name} {name}" if device_name else name
+            return device_entry.name_by_user or device_entry.name
+        # Device entries are immutable and replaced on every registry update,
+        # so the combined name only needs to be rebuilt when either changes.
+        # Reusing the same string object also lets the state machine compare
+        # the attribute with an identity check.
+        if (
+            (cached := self.__device_friendly_name) is not None
+            and cached[0] is device_entry
+            and cached[1] is name
+        ):
+            return cached[2]
+        device_name = device_entry.name_by_user or device_entry.name
+        friendly_name = f"{device_name} {name}" if device_name else name
+        self.__device_friendly_name = (device_entry, name, friendly_name)
+        return friendly_name
 
     @callback
     def _async_calculate_state(self) -> CalculatedState:
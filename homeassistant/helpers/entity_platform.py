@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
@@ -47,9 +47,11 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling_backoff import PollingBackoff
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
+    from .device_registry import DeviceInfo
     from .entity import Entity
 
 
@@ -71,6 +73,21 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 _LOGGER = getLogger(__name__)
 
 
+def _device_info_cache_key(device_info: DeviceInfo) -> Hashable | None:
+    """Return a hashable key for device info or None if it is not hashable."""
+    try:
+        key = tuple(
+            sorted(
+                (field, frozenset(value) if isinstance(value, set) else value)
+                for field, value in device_info.items()
+            )
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
 
@@ -136,6 +153,11 @@ class EntityPlatform:
         self.platform = platform
         self.scan_interval = scan_interval
         self.scan_interval_seconds = scan_interval.total_seconds()
+        # Platforms opt in to adaptive polling by defining MAX_SCAN_INTERVAL
+        self.max_scan_interval: timedelta | None = getattr(
+            platform, "MAX_SCAN_INTERVAL", None
+        )
+        self._polling_backoffs: dict[str, PollingBackoff] = {}
         self.entity_namespace = entity_namespace
         self.config_entry: config_entries.ConfigEntry | None = None
         # Storage for entities for this specific platform only
@@ -627,11 +649,16 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        # Entities of the same device usually share identical device info,
+        # so the device is only resolved once per batch.
+        device_cache: dict[Hashable, dev_reg.DeviceEntry] = {}
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity, update_before_add, entity_registry, device_cache
+                )
             )
             entities.append(entity)
 
@@ -689,6 +716,30 @@ class EntityPlatform:
                 eager_start=True,
             )
 
+    @callback
+    def _async_get_or_create_device(
+        self,
+        config_entry: config_entries.ConfigEntry,
+        device_info: DeviceInfo,
+        device_cache: dict[Hashable, dev_reg.DeviceEntry],
+    ) -> dev_reg.DeviceEntry:
+        """Get or create a device, reusing the result for identical device info."""
+        device_registry = dev_reg.async_get(self.hass)
+        cache_key = _device_info_cache_key(device_info)
+        if (
+            cache_key is not None
+            and (device := device_cache.get(cache_key)) is not None
+            # Device entries are immutable, any update replaces the entry
+            and device_registry.devices.get(device.id) is device
+        ):
+            return device
+        device = device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id, **device_info
+        )
+        if cache_key is not None:
+            device_cache[cache_key] = device
+        return device
+
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
 
@@ -710,6 +761,7 @@ class EntityPlatform:
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_cache: dict[Hashable, dev_reg.DeviceEntry],
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -767,9 +819,8 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
+                    device = self._async_get_or_create_device(
+                        self.config_entry, device_info, device_cache
                     )
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
@@ -912,6 +963,7 @@ class EntityPlatform:
             del self.entities[entity_id]
             del self.domain_entities[entity_id]
             del self.domain_platform_entities[entity_id]
+            self._polling_backoffs.pop(entity_id, None)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -949,6 +1001,12 @@ class EntityPlatform:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
 
+    @callback
+    def async_reset_polling_backoff(self, entity_id: str) -> None:
+        """Poll an entity at the base scan interval again."""
+        if (backoff := self._polling_backoffs.get(entity_id)) is not None:
+            backoff.async_reset()
+
     @callback
     def async_prepare(self) -> None:
         """Register the entity platform in DATA_ENTITY_PLATFORM."""
@@ -1042,19 +1100,58 @@ class EntityPlatform:
                     # If the entity is removed from hass during the previous
                     # entity being updated, we need to skip updating the
                     # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
+                    if (
+                        entity.should_poll
+                        and entity.hass
+                        and (coro := self._async_poll_entity(entity))
+                    ):
+                        await coro
                 return
 
             if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
+                create_eager_task(coro, loop=self.hass.loop)
                 for entity in self.entities.values()
-                if entity.should_poll
+                if entity.should_poll and (coro := self._async_poll_entity(entity))
             ]:
                 await asyncio.gather(*tasks)
 
+    @callback
+    def _async_poll_entity(self, entity: Entity) -> Coroutine[Any, Any, None] | None:
+        """Return a coroutine to poll an entity or None if it is not due."""
+        if self.max_scan_interval is None:
+            return entity.async_update_ha_state(True)
+        entity_id = entity.entity_id
+        if (backoff := self._polling_backoffs.get(entity_id)) is None:
+            backoff = self._polling_backoffs[entity_id] = PollingBackoff(
+                self.max_scan_interval
+            )
+        if not backoff.async_tick():
+            return None
+        return self._async_poll_entity_with_backoff(entity, backoff)
+
+    async def _async_poll_entity_with_backoff(
+        self, entity: Entity, backoff: PollingBackoff
+    ) -> None:
+        """Poll an entity and back off while its state is unchanged."""
+        states = self.hass.states
+        entity_id = entity.entity_id
+        previous_state = states.get(entity_id)
+        await entity.async_update_ha_state(True)
+        # The state machine keeps the same State object when neither the
+        # state nor the attributes changed, unless the entity forces updates
+        # in which case the state and attributes are compared.
+        current_state = states.get(entity_id)
+        backoff.async_record(
+            current_state is not previous_state
+            and (
+                current_state is None
+                or previous_state is None
+                or current_state.state != previous_state.state
+                or current_state.attributes != previous_state.attributes
+            ),
+            self.scan_interval_seconds,
+        )
+
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
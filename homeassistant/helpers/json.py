@@ -1,7 +1,7 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import datetime
 from functools import partial
 import json
@@ -143,6 +143,11 @@ def json_bytes_strip_null(data: Any) -> bytes:
     return json_bytes(_strip_null(orjson.loads(result)))
 
 
+def json_bytes_array(items: Iterable[bytes]) -> bytes:
+    """Join already serialized JSON values into a JSON array."""
+    return b"".join((b"[", b",".join(items), b"]"))
+
+
 json_fragment = orjson.Fragment
 
 
@@ -0,0 +1,65 @@
+"""Helper to back off polling while polled data is unchanged."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import callback
+
+# Number of unchanged polls in a row before the interval is increased
+POLLING_BACKOFF_UNCHANGED_POLLS = 3
+POLLING_BACKOFF_FACTOR = 2
+
+
+class PollingBackoff:
+    """Track an adaptive polling interval.
+
+    The interval multiplier grows by POLLING_BACKOFF_FACTOR after every
+    POLLING_BACKOFF_UNCHANGED_POLLS polls that did not change any data,
+    as long as the resulting interval stays within max_interval. The
+    multiplier snaps back to 1 as soon as the data changes or the backoff
+    is reset, for example because of user interaction.
+    """
+
+    __slots__ = (
+        "_max_interval_seconds",
+        "_polls_until_due",
+        "_unchanged_polls",
+        "multiplier",
+    )
+
+    def __init__(self, max_interval: timedelta) -> None:
+        """Initialize the backoff."""
+        self._max_interval_seconds = max_interval.total_seconds()
+        self._unchanged_polls = 0
+        self._polls_until_due = 0
+        self.multiplier = 1
+
+    @callback
+    def async_record(self, changed: bool, interval_seconds: float) -> None:
+        """Record the outcome of a poll at the base interval_seconds."""
+        if changed:
+            self.async_reset()
+            return
+        self._unchanged_polls += 1
+        if (
+            self._unchanged_polls >= POLLING_BACKOFF_UNCHANGED_POLLS
+            and interval_seconds * self.multiplier * POLLING_BACKOFF_FACTOR
+            <= self._max_interval_seconds
+        ):
+            self.multiplier *= POLLING_BACKOFF_FACTOR
+            self._unchanged_polls = 0
+        self._polls_until_due = self.multiplier
+
+    @callback
+    def async_reset(self) -> None:
+        """Go back to polling at the base interval."""
+        self.multiplier = 1
+        self._unchanged_polls = 0
+        self._polls_until_due = 0
+
+    @callback
+    def async_tick(self) -> bool:
+        """Advance one base interval and return if a poll is due."""
+        self._polls_until_due -= 1
+        return self._polls_until_due <= 0
@@ -23,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN: HassKey[RecorderData] = HassKey("recorder")
 DATA_INSTANCE: HassKey[Recorder] = HassKey("recorder_instance")
 
+# Key in Session.info set when the session was opened as read only
+SESSION_INFO_READ_ONLY = "read_only"
+
 
 @dataclass(slots=True)
 class RecorderData:
@@ -90,12 +93,17 @@ def session_scope(
     data and that no commit is required. It does not prevent the session
     from writing and is not a security measure.
     """
+    created_session = False
     if session is None and hass is not None:
         session = get_instance(hass).get_session()
+        created_session = True
 
     if session is None:
         raise RuntimeError("Session required")
 
+    if created_session:
+        session.info[SESSION_INFO_READ_ONLY] = read_only
+
     need_rollback = False
     try:
         yield session
@@ -109,4 +117,6 @@ def session_scope(
         if not exception_filter or not exception_filter(err):
             raise
     finally:
+        if created_session:
+            session.info.pop(SESSION_INFO_READ_ONLY, None)
         session.close()
@@ -1011,6 +1011,7 @@ async def entity_service_call(
             # Context expires if the turn on commands took a long time.
             # Set context again so it's there when we update
             entity.async_set_context(call.context)
+            entity.platform.async_reset_polling_backoff(entity.entity_id)
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
@@ -1041,6 +1042,7 @@ async def entity_service_call(
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
         entity.async_set_context(call.context)
+        entity.platform.async_reset_polling_backoff(entity.entity_id)
         tasks.append(create_eager_task(entity.async_update_ha_state(True)))
 
     if tasks:
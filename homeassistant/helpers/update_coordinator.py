@@ -5,12 +5,13 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
+from zlib import crc32
 
 import aiohttp
 from propcache import cached_property
@@ -26,15 +27,32 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
 from .frame import report_usage
+from .polling_backoff import PollingBackoff
+from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Scheduled refreshes are batched into time wheel slots of this resolution
+# so coordinators due in the same slot share a single loop timer.
+REFRESH_SLOTS_PER_SECOND = 20
+_REFRESH_JITTER_SLOT_MIN = (
+    event.RANDOM_MICROSECOND_MIN * REFRESH_SLOTS_PER_SECOND // 10**6
+)
+_REFRESH_JITTER_SLOT_MAX = (
+    event.RANDOM_MICROSECOND_MAX * REFRESH_SLOTS_PER_SECOND // 10**6
+)
+
+DATA_REFRESH_SCHEDULER: HassKey[RefreshScheduler] = HassKey(
+    "update_coordinator_refresh_scheduler"
+)
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -47,6 +65,101 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class RefreshStatistics:
+    """Refresh latency and overrun metrics of a coordinator."""
+
+    refresh_count: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    overrun_count: int = 0
+    coalesced_request_count: int = 0
+    last_schedule_lag: float = 0.0
+    max_schedule_lag: float = 0.0
+
+    @property
+    def average_duration(self) -> float | None:
+        """Return the average refresh duration in seconds."""
+        if not self.refresh_count:
+            return None
+        return self.total_duration / self.refresh_count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            "refresh_count": self.refresh_count,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "average_duration": self.average_duration,
+            "overrun_count": self.overrun_count,
+            "coalesced_request_count": self.coalesced_request_count,
+            "last_schedule_lag": self.last_schedule_lag,
+            "max_schedule_lag": self.max_schedule_lag,
+        }
+
+
+class RefreshScheduler:
+    """Shared time wheel for scheduled coordinator refreshes.
+
+    Refreshes are bucketed into slots of 1/REFRESH_SLOTS_PER_SECOND seconds
+    and every occupied slot is served by a single loop timer, so many
+    coordinators due at the same time only wake the event loop once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._loop = hass.loop
+        self._slots: dict[int, dict[object, CALLBACK_TYPE]] = {}
+        self._handles: dict[int, asyncio.TimerHandle] = {}
+
+    @property
+    def scheduled_count(self) -> int:
+        """Return the number of scheduled refreshes."""
+        return sum(len(actions) for actions in self._slots.values())
+
+    @property
+    def timer_count(self) -> int:
+        """Return the number of loop timers in use."""
+        return len(self._handles)
+
+    @callback
+    def async_schedule(self, slot: int, action: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Schedule action to run at the given time wheel slot."""
+        if (actions := self._slots.get(slot)) is None:
+            actions = self._slots[slot] = {}
+            self._handles[slot] = self._loop.call_at(
+                slot / REFRESH_SLOTS_PER_SECOND, self._async_run_slot, slot
+            )
+        token = object()
+        actions[token] = action
+
+        @callback
+        def _async_cancel() -> None:
+            """Remove the action from its slot."""
+            if (actions := self._slots.get(slot)) is None:
+                return
+            if actions.pop(token, None) is not None and not actions:
+                del self._slots[slot]
+                self._handles.pop(slot).cancel()
+
+        return _async_cancel
+
+    @callback
+    def _async_run_slot(self, slot: int) -> None:
+        """Run all actions due in a slot."""
+        del self._handles[slot]
+        for action in self._slots.pop(slot).values():
+            action()
+
+
+@callback
+@singleton(DATA_REFRESH_SCHEDULER)
+def async_get_refresh_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Get the shared refresh scheduler."""
+    return RefreshScheduler(hass)
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -63,6 +176,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting ``max_update_interval`` enables adaptive polling: the update
+    interval backs off up to ``max_update_interval`` while consecutive
+    refreshes return equal data and snaps back to ``update_interval`` when
+    the data changes or a refresh is requested. This also requires the data
+    to implement ``__eq__``.
     """
 
     def __init__(
@@ -77,6 +196,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        max_update_interval: timedelta | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -94,6 +214,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        self._polling_backoff = (
+            PollingBackoff(max_update_interval) if max_update_interval else None
+        )
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -102,11 +225,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
+        # Pick a deterministic time wheel slot in range 0.05..0.50 to stagger
+        # the refreshes and avoid a thundering herd. The slot is derived from
+        # the coordinator identity so it is stable across restarts.
+        jitter_key = f"{name}-{self.config_entry.entry_id if self.config_entry else ''}"
+        self._jitter_slot = _REFRESH_JITTER_SLOT_MIN + crc32(jitter_key.encode()) % (
+            _REFRESH_JITTER_SLOT_MAX - _REFRESH_JITTER_SLOT_MIN + 1
         )
+        self._scheduled_refresh_at: float | None = None
+        self._refresh_done: asyncio.Future[None] | None = None
+        self._follow_up_refresh_done: asyncio.Future[None] | None = None
+        self.refresh_statistics = RefreshStatistics()
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
@@ -217,6 +346,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
 
+    @property
+    def current_update_interval(self) -> timedelta | None:
+        """Interval until the next update, including any adaptive backoff."""
+        if self._update_interval is None or self._polling_backoff is None:
+            return self._update_interval
+        return self._update_interval * self._polling_backoff.multiplier
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
@@ -230,22 +366,32 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We use the shared time wheel because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
-        # calling dt_util.utcnow() on every update.
+        # calling dt_util.utcnow() on every update. The interval is truncated
+        # to the slot resolution so the refresh never fires late.
         hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        interval = self._update_interval_seconds
+        if self._polling_backoff is not None:
+            interval *= self._polling_backoff.multiplier
+        next_slot = (
+            int(hass.loop.time()) * REFRESH_SLOTS_PER_SECOND
+            + self._jitter_slot
+            + int(interval * REFRESH_SLOTS_PER_SECOND)
+        )
+        self._scheduled_refresh_at = next_slot / REFRESH_SLOTS_PER_SECOND
+        self._unsub_refresh = async_get_refresh_scheduler(hass).async_schedule(
+            next_slot, self.__wrap_handle_refresh_interval
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, self.__wrap_handle_refresh_interval
-        ).cancel
 
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
         """Handle a refresh interval occurrence."""
+        if self._scheduled_refresh_at is not None:
+            stats = self.refresh_statistics
+            lag = max(0.0, self.hass.loop.time() - self._scheduled_refresh_at)
+            stats.last_schedule_lag = lag
+            stats.max_schedule_lag = max(stats.max_schedule_lag, lag)
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -268,9 +414,31 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def async_request_refresh(self) -> None:
         """Request a refresh.
 
-        Refresh will wait a bit to see if it can batch them.
+        Refresh will wait a bit to see if it can batch them. If a refresh
+        is already in progress, it may have fetched the data before the
+        change that prompted the request, so a single follow-up refresh
+        is run once it is done and is shared by all requests made
+        meanwhile.
         """
-        await self._debounced_refresh.async_call()
+        if self._polling_backoff is not None:
+            self._polling_backoff.async_reset()
+        if (refresh_done := self._refresh_done) is None:
+            await self._debounced_refresh.async_call()
+            return
+        if (follow_up_done := self._follow_up_refresh_done) is not None:
+            self.refresh_statistics.coalesced_request_count += 1
+            await asyncio.shield(follow_up_done)
+            return
+        self._follow_up_refresh_done = follow_up_done = self.hass.loop.create_future()
+        try:
+            await asyncio.shield(refresh_done)
+            # Requests made from now on need a refresh after this one
+            self._follow_up_refresh_done = None
+            await self._debounced_refresh.async_call()
+        finally:
+            if self._follow_up_refresh_done is follow_up_done:
+                self._follow_up_refresh_done = None
+            follow_up_done.set_result(None)
 
     async def _async_update_data(self) -> _DataT:
         """Fetch the latest data from the source."""
@@ -367,8 +535,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        start = monotonic()
+        if (refresh_done := self._refresh_done) is None:
+            self._refresh_done = refresh_done = self.hass.loop.create_future()
+            owns_refresh_done = True
+        else:
+            owns_refresh_done = False
 
         auth_failed = False
         previous_update_success = self.last_update_success
@@ -454,11 +627,26 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            duration = monotonic() - start
+            self._async_record_refresh_duration(duration)
+            if owns_refresh_done:
+                self._refresh_done = None
+                refresh_done.set_result(None)
+            if (
+                self._polling_backoff is not None
+                and self._update_interval_seconds is not None
+            ):
+                self._polling_backoff.async_record(
+                    not self.last_update_success
+                    or not previous_update_success
+                    or previous_data != self.data,
+                    self._update_interval_seconds,
+                )
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -476,6 +664,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         ):
             self.async_update_listeners()
 
+    @callback
+    def _async_record_refresh_duration(self, duration: float) -> None:
+        """Record the duration of a refresh."""
+        stats = self.refresh_statistics
+        stats.refresh_count += 1
+        stats.last_duration = duration
+        stats.total_duration += duration
+        stats.max_duration = max(stats.max_duration, duration)
+        if (
+            self._update_interval_seconds is not None
+            and duration > self._update_interval_seconds
+        ):
+            stats.overrun_count += 1
+            self.logger.debug(
+                "Fetching %s data took %.3f seconds, longer than the update"
+                " interval of %s seconds",
+                self.name,
+                duration,
+                self._update_interval_seconds,
+            )
+
     @callback
     def _async_refresh_finished(self) -> None:
         """Handle when a refresh has finished.
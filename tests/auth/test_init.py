@@ -6,6 +6,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import jwt
 import pytest
 import voluptuous as vol
@@ -16,6 +17,7 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
@@ -390,6 +392,36 @@ async def test_cannot_retrieve_expired_access_token(hass: HomeAssistant) -> None
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_is_remembered(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an access token is only verified once until it is revoked."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as mock_verify_and_decode:
+        for _ in range(2):
+            assert manager.async_validate_access_token(access_token) is refresh_token
+        assert len(mock_verify_and_decode.mock_calls) == 1
+
+        user.is_active = False
+        assert manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+
+        freezer.tick(auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(seconds=11))
+        assert manager.async_validate_access_token(access_token) is None
+        freezer.tick(-auth_const.ACCESS_TOKEN_EXPIRATION - timedelta(seconds=11))
+
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        manager.async_remove_refresh_token(refresh_token)
+        assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass: HomeAssistant) -> None:
     """Test that we can add a system user."""
     events = []
@@ -915,6 +915,8 @@ class MockEntityPlatform(entity_platform.EntityPlatform):
         # Otherwise the constructor will blow up.
         if isinstance(platform, Mock) and isinstance(platform.PARALLEL_UPDATES, Mock):
             platform.PARALLEL_UPDATES = 0
+        if isinstance(platform, Mock) and isinstance(platform.MAX_SCAN_INTERVAL, Mock):
+            platform.MAX_SCAN_INTERVAL = None
 
         super().__init__(
             hass=hass,
@@ -293,6 +293,52 @@ async def test_api_get_event_listeners(
     assert len(local) == 0
 
 
+async def test_api_get_states_etag(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the states are served with an ETag until a state changes."""
+    hass.states.async_set("hello.world", "nice")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+
+    hass.states.async_set("hello.world", "nicer")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert [state["state"] for state in await resp.json()] == ["nicer"]
+
+
+async def test_api_get_services_etag(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the services are served with an ETag until a service changes."""
+    resp = await mock_api_client.get(const.URL_API_SERVICES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.services.async_register("test_domain", "test_service", lambda call: None)
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert "test_domain" in {service["domain"] for service in await resp.json()}
+
+
 async def test_api_get_services(
     hass: HomeAssistant, mock_api_client: TestClient
 ) -> None:
@@ -37,6 +37,7 @@ from homeassistant.components.bluetooth.match import (
     MANUFACTURER_ID,
     SERVICE_DATA_UUID,
     SERVICE_UUID,
+    BluetoothMatcherIndex,
 )
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
@@ -774,6 +775,71 @@ async def test_discovery_match_by_manufacturer_id_and_manufacturer_data_start(
         assert len(mock_config_flow.mock_calls) == 0
 
 
+@pytest.mark.usefixtures("macos_adapter")
+async def test_discovery_not_matched_until_matched_data_changes(
+    hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
+) -> None:
+    """Test an unmatched device is only matched again when matched data changes."""
+    mock_bt = [
+        {
+            "domain": "homekit_controller",
+            "manufacturer_id": 76,
+            "manufacturer_data_start": [0x06, 0x02, 0x03],
+        }
+    ]
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with (
+        patch.object(hass.config_entries.flow, "async_init") as mock_config_flow,
+        patch.object(
+            BluetoothMatcherIndex,
+            "match",
+            autospec=True,
+            side_effect=BluetoothMatcherIndex.match,
+        ) as mock_match,
+    ):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        device = generate_ble_device("44:44:33:11:23:45", "lock")
+        inject_advertisement(
+            hass,
+            device,
+            generate_advertisement_data(
+                local_name="lock", manufacturer_data={76: b"\x10\x05\x01\x01"}
+            ),
+        )
+        await hass.async_block_till_done()
+        assert len(mock_match.mock_calls) == 1
+
+        # Only bytes after the matched manufacturer data start changed
+        inject_advertisement(
+            hass,
+            device,
+            generate_advertisement_data(
+                local_name="lock", manufacturer_data={76: b"\x10\x05\x01\x02"}
+            ),
+        )
+        await hass.async_block_till_done()
+        assert len(mock_match.mock_calls) == 1
+        assert len(mock_config_flow.mock_calls) == 0
+
+        inject_advertisement(
+            hass,
+            device,
+            generate_advertisement_data(
+                local_name="lock", manufacturer_data={76: b"\x06\x02\x03\x02"}
+            ),
+        )
+        await hass.async_block_till_done()
+        assert len(mock_match.mock_calls) == 2
+        assert len(mock_config_flow.mock_calls) == 1
+        assert mock_config_flow.mock_calls[0][1][0] == "homekit_controller"
+
+
 @pytest.mark.usefixtures("macos_adapter")
 async def test_discovery_match_by_service_data_uuid_then_others(
     hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
@@ -394,6 +394,81 @@ async def test_entity_key_is_dispatched_on_entity_key_change(
     cancel_coordinator()
 
 
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+async def test_repeated_advertisement_is_not_processed(
+    hass: HomeAssistant,
+) -> None:
+    """Test an advertisement repeating the last processed one is not processed."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    processed: list[dict[int, bytes]] = []
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        processed.append(service_info.manufacturer_data)
+        return {"test": "data"}
+
+    @callback
+    def _async_generate_mock_data(
+        data: dict[str, str],
+    ) -> PassiveBluetoothDataUpdate:
+        """Generate mock data."""
+        return GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    processor = PassiveBluetoothDataProcessor(_async_generate_mock_data)
+    unregister_processor = coordinator.async_register_processor(processor)
+    cancel_coordinator = coordinator.async_start()
+
+    # The manager only drops repeats of the last advertisement it dispatched
+    # from an address, which may not have been dispatched to this coordinator
+    for service_info in (
+        GENERIC_BLUETOOTH_SERVICE_INFO,
+        GENERIC_BLUETOOTH_SERVICE_INFO,
+        GENERIC_BLUETOOTH_SERVICE_INFO_2,
+        GENERIC_BLUETOOTH_SERVICE_INFO,
+        GENERIC_BLUETOOTH_SERVICE_INFO,
+    ):
+        coordinator._async_handle_bluetooth_event(
+            service_info, BluetoothChange.ADVERTISEMENT
+        )
+    # A device returning to earlier data is processed again
+    assert processed == [
+        GENERIC_BLUETOOTH_SERVICE_INFO.manufacturer_data,
+        GENERIC_BLUETOOTH_SERVICE_INFO_2.manufacturer_data,
+        GENERIC_BLUETOOTH_SERVICE_INFO.manufacturer_data,
+    ]
+    assert coordinator.processed_count == 3
+    assert coordinator.duplicate_count == 2
+
+    # A new processor needs the data again
+    unregister_processor()
+    unregister_processor = coordinator.async_register_processor(processor)
+    coordinator._async_handle_bluetooth_event(
+        GENERIC_BLUETOOTH_SERVICE_INFO, BluetoothChange.ADVERTISEMENT
+    )
+    assert len(processed) == 4
+    assert coordinator.processed_count == 4
+
+    hass.set_state(CoreState.stopping)
+    coordinator._async_handle_bluetooth_event(
+        GENERIC_BLUETOOTH_SERVICE_INFO_2, BluetoothChange.ADVERTISEMENT
+    )
+    assert len(processed) == 4
+    assert coordinator.dropped_count == 1
+    hass.set_state(CoreState.running)
+
+    unregister_processor()
+    cancel_coordinator()
+
+
 @pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
 async def test_unavailable_after_no_data(hass: HomeAssistant) -> None:
     """Test that the coordinator is unavailable after no data for a while."""
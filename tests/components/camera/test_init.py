@@ -1,10 +1,12 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
 from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 from webrtc_models import RTCIceCandidate
@@ -204,6 +206,98 @@ async def test_get_image_fails(hass: HomeAssistant) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_reuses_recent_snapshot(hass: HomeAssistant) -> None:
+    """Test snapshots are reused per size for the snapshot max age."""
+    camera_entity = get_camera_from_entity_id(hass, "camera.demo_camera")
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=[b"first", b"second", b"third", b"fourth", b"fifth"],
+    ) as mock_camera_image:
+        # Snapshots are not reused by default
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"first"
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"second"
+        assert mock_camera_image.call_count == 2
+        assert not camera_entity._snapshot_cache
+
+        camera_entity._attr_snapshot_max_age = 0.5
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"third"
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"third"
+        assert mock_camera_image.call_count == 3
+
+        # Another size is fetched separately
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=640, height=480
+        )
+        assert image.content == b"fourth"
+        assert mock_camera_image.call_count == 4
+
+        camera_entity._attr_snapshot_max_age = 0
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"fifth"
+        assert mock_camera_image.call_count == 5
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_evicts_expired_snapshots(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test expired snapshots are removed when the snapshots are read."""
+    camera_entity = get_camera_from_entity_id(hass, "camera.demo_camera")
+    camera_entity._attr_snapshot_max_age = 0.5
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=[b"first", b"second"],
+    ):
+        await camera.async_get_image(hass, "camera.demo_camera")
+        freezer.tick(0.3)
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        freezer.tick(0.3)
+
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=640, height=480
+        )
+
+    assert image.content == b"second"
+    assert list(camera_entity._snapshot_cache) == [(640, 480)]
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_concurrent_requests_share_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent requests for a snapshot share a single fetch."""
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def _async_camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes:
+        fetch_started.set()
+        await release_fetch.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_async_camera_image,
+    ) as mock_camera_image:
+        first = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetch_started.wait()
+        second = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await asyncio.sleep(0)
+        release_fetch.set()
+        images = await asyncio.gather(first, second)
+
+    assert mock_camera_image.call_count == 1
+    assert [image.content for image in images] == [b"Test", b"Test"]
+
+
 @pytest.mark.usefixtures("mock_camera")
 @pytest.mark.parametrize(
     ("filename_template", "expected_filename", "expected_issues"),
@@ -2,7 +2,8 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from typing import Any
+from unittest.mock import ANY, MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -173,6 +174,96 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for value in range(50):
+            freezer.tick(timedelta(seconds=1))
+            if value == 25:
+                hass.states.async_set("sensor.power", "1000")
+            elif value == 30:
+                hass.states.async_set("sensor.power", "unavailable")
+            else:
+                hass.states.async_set("sensor.power", str(value % 5))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_history = response["result"]["sensor.power"]
+
+    # Four buckets with their min and max plus the first and last state,
+    # the unavailable state splits the third bucket in two
+    assert len(sensor_history) == 13
+    states = [state["s"] for state in sensor_history]
+    assert states[0] == "0"
+    assert states[-1] == "4"
+    assert "1000" in states
+    assert "unavailable" in states
+    timestamps = [state["lu"] for state in sensor_history]
+    assert timestamps == sorted(timestamps)
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 50
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "max_points": "10",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 13
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -543,6 +634,140 @@ async def test_history_stream_historical_only(
     }
 
 
+@patch("homeassistant.components.history.websocket_api.HISTORY_STREAM_CHUNK_STATES", 3)
+async def test_history_stream_historical_only_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends large historical responses in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4"):
+        hass.states.async_set("sensor.one", state)
+        hass.states.async_set("sensor.two", state)
+        await async_recorder_block_till_done(hass)
+    sensor_two_last_updated_timestamp = hass.states.get(
+        "sensor.two"
+    ).last_updated_timestamp
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    states: dict[str, list[dict[str, Any]]] = {}
+    for _ in range(4):
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        assert sum(len(chunk) for chunk in response["event"]["states"].values()) <= 3
+        for entity_id, chunk in response["event"]["states"].items():
+            states.setdefault(entity_id, []).extend(chunk)
+
+    assert response["event"]["end_time"] == pytest.approx(
+        sensor_two_last_updated_timestamp
+    )
+    assert [state["s"] for state in states["sensor.one"]] == ["1", "2", "3", "4"]
+    assert [state["s"] for state in states["sensor.two"]] == ["1", "2", "3", "4"]
+
+
+@patch("homeassistant.components.history.websocket_api.HISTORY_STREAM_CHUNK_STATES", 3)
+async def test_history_stream_historical_only_single_entity_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream splits the states of a single entity into chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4", "5", "6", "7"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    chunks: list[list[str]] = []
+    for _ in range(3):
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        chunks.append(
+            [state["s"] for state in response["event"]["states"]["sensor.one"]]
+        )
+
+    assert chunks == [["1", "2", "3"], ["4", "5", "6"], ["7"]]
+
+
+@patch("homeassistant.components.history.websocket_api.HISTORY_STREAM_CHUNK_STATES", 2)
+async def test_history_stream_historical_stops_after_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test generating historical chunks stops once the client unsubscribed."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4", "5", "6", "7"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    connection = MagicMock(subscriptions={})
+    result = await recorder_mock.async_add_executor_job(
+        websocket_api._generate_historical_response,
+        hass,
+        connection,
+        1,
+        now,
+        end_time,
+        ["sensor.one"],
+        True,
+        False,
+        True,
+        True,
+        True,
+    )
+    await hass.async_block_till_done()
+
+    assert result[1:] == (None, None)
+    assert connection.send_message.call_count == 1
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
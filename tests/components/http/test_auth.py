@@ -9,10 +9,12 @@ from unittest.mock import Mock, patch
 
 from aiohttp import BasicAuth, web
 from aiohttp.web_exceptions import HTTPUnauthorized
+from freezegun.api import FrozenDateTimeFactory
 import jwt
 import pytest
 import yarl
 
+from homeassistant.auth import jwt_wrapper
 from homeassistant.auth.const import GROUP_ID_READ_ONLY
 from homeassistant.auth.models import User
 from homeassistant.auth.providers import trusted_networks
@@ -333,6 +335,39 @@ async def test_auth_access_signed_path_with_refresh_token(
     assert req.status == HTTPStatus.UNAUTHORIZED
 
 
+async def test_auth_access_signed_path_verified_once(
+    hass: HomeAssistant,
+    app: web.Application,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a signature is only verified once until it expires."""
+    await async_setup_auth(hass, app)
+    client = await aiohttp_client(app)
+    refresh_token = hass.auth.async_validate_access_token(hass_access_token)
+    signed_path = async_sign_path(
+        hass, "/", timedelta(seconds=5), refresh_token_id=refresh_token.id
+    )
+
+    with patch(
+        "homeassistant.components.http.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as mock_verify_and_decode:
+        for _ in range(2):
+            req = await client.get(signed_path)
+            assert req.status == HTTPStatus.OK
+        assert len(mock_verify_and_decode.mock_calls) == 1
+
+        # Query parameters are still checked against the cached claims
+        req = await client.get(f"{signed_path}&test=test")
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+        freezer.tick(timedelta(seconds=6))
+        req = await client.get(signed_path)
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+
 async def test_auth_access_signed_path_with_query_param(
     hass: HomeAssistant,
     app: web.Application,
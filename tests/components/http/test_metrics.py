@@ -0,0 +1,149 @@
+"""Test the HTTP metrics."""
+
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+
+from aiohttp import web
+
+from homeassistant.components.http.headers import setup_headers
+from homeassistant.components.http.metrics import (
+    UNMATCHED_ROUTE,
+    HttpMetrics,
+    setup_metrics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.typing import ClientSessionGenerator
+
+
+async def mock_handler(_: web.Request) -> web.Response:
+    """Return OK."""
+    return web.Response(text="OK")
+
+
+async def test_metrics_recorded(
+    aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test latency of routes and middlewares is recorded."""
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(b"0123456789")
+
+    async def file_handler(_: web.Request) -> web.FileResponse:
+        return web.FileResponse(file_path)
+
+    websocket_closed = asyncio.Event()
+
+    async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        await websocket.send_str(await websocket.receive_str())
+        await websocket.close()
+        websocket_closed.set()
+        return websocket
+
+    app = web.Application()
+    app.router.add_get("/item/{item_id}", mock_handler)
+    app.router.add_get("/file", file_handler)
+    app.router.add_get("/websocket", websocket_handler)
+    setup_headers(app, use_x_frame_options=True)
+    metrics = HttpMetrics()
+    setup_metrics(app, metrics)
+
+    client = await aiohttp_client(app)
+    for item_id in ("1", "2"):
+        resp = await client.get(f"/item/{item_id}")
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["X-Frame-Options"] == "SAMEORIGIN"
+    resp = await client.get("/not_found")
+    assert resp.status == HTTPStatus.NOT_FOUND
+    resp = await client.get("/file")
+    assert await resp.read() == b"0123456789"
+
+    websocket = await client.ws_connect("/websocket")
+    await websocket.send_str("hello")
+    assert metrics.websockets == 1
+    assert metrics.in_flight == 0
+    assert await websocket.receive_str() == "hello"
+    await websocket.close()
+    await websocket_closed.wait()
+
+    result = metrics.as_dict()
+    assert result["in_flight"] == 0
+    assert result["websockets"] == 0
+    routes = {(route["method"], route["route"]): route for route in result["routes"]}
+    # Websocket connections are not counted as route requests
+    assert routes.keys() == {
+        ("GET", "/item/{item_id}"),
+        ("GET", "/file"),
+        ("*", UNMATCHED_ROUTE),
+    }
+    item_route = routes["GET", "/item/{item_id}"]
+    assert item_route["count"] == 2
+    assert item_route["response_bytes"] == 4
+    assert sum(bucket["count"] for bucket in item_route["histogram"]) == 2
+    # File responses are only written after the middlewares returned
+    assert routes["GET", "/file"]["response_bytes"] == 10
+    assert routes["*", UNMATCHED_ROUTE]["response_bytes"] > 0
+    assert result["middlewares"].keys() == {"headers_middleware"}
+    assert result["middlewares"]["headers_middleware"]["count"] == 5
+
+    prometheus = metrics.as_prometheus()
+    assert "homeassistant_http_requests_in_flight 0" in prometheus
+    assert "homeassistant_http_websockets_open 0" in prometheus
+    assert (
+        'homeassistant_http_request_duration_seconds_count{method="GET",'
+        'route="/item/{item_id}"} 2'
+    ) in prometheus
+    assert (
+        'homeassistant_http_request_duration_seconds_bucket{method="GET",'
+        'route="/item/{item_id}",le="+Inf"} 2'
+    ) in prometheus
+    assert (
+        'homeassistant_http_response_size_bytes_total{method="GET",'
+        'route="/item/{item_id}"} 4'
+    ) in prometheus
+    assert (
+        'homeassistant_http_middleware_duration_seconds_count{middleware="headers_middleware"} 5'
+    ) in prometheus
+
+    metrics.reset()
+    assert metrics.as_dict()["routes"] == []
+
+
+async def test_metrics_view(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the metrics are exposed when enabled."""
+    assert await async_setup_component(hass, "http", {"http": {"metrics": True}})
+    assert hass.http.metrics is not None
+
+    client = await hass_client()
+    resp = await client.get("/api/http_metrics")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Type"].startswith("text/plain")
+    # The request is still in flight while the metrics are rendered
+    assert "homeassistant_http_requests_in_flight 1" in await resp.text()
+
+    resp = await client.get("/api/http_metrics")
+    text = await resp.text()
+    assert (
+        'homeassistant_http_request_duration_seconds_count{method="GET",'
+        'route="/api/http_metrics"} 1'
+    ) in text
+    assert 'middleware="auth_middleware"' in text
+
+
+async def test_metrics_disabled(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test no metrics are recorded by default."""
+    assert await async_setup_component(hass, "http", {})
+    assert hass.http.metrics is None
+
+    client = await hass_client()
+    resp = await client.get("/api/http_metrics")
+    assert resp.status == HTTPStatus.NOT_FOUND
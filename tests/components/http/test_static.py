@@ -1,12 +1,15 @@
 """The tests for http static files."""
 
+import gzip
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
+from aiohttp.web import FileResponse
 import pytest
 
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import StaticPathConfig, static
 from homeassistant.components.http.static import CachingStaticResource
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
@@ -63,3 +66,106 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_small_files_served_from_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small files are served from memory once their path is resolved."""
+    app = hass.http.app
+    (tmp_path / "app.js").write_text("console.log('hello');")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('hello');"))
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get("/static/app.js")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    with patch.object(
+        FileResponse, "prepare", side_effect=AssertionError("read from disk")
+    ):
+        resp = await mock_http_client.get(
+            "/static/app.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Cache-Control"] == static.CACHE_HEADER
+        assert resp.content_type == "text/javascript"
+        assert await resp.text() == "console.log('hello');"
+        assert "Content-Encoding" not in resp.headers
+
+        resp = await mock_http_client.get(
+            "/static/app.js", headers={"Accept-Encoding": "gzip"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["ETag"] == etag
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert await resp.text() == "console.log('hello');"
+
+        resp = await mock_http_client.get(
+            "/static/app.js", headers={"If-None-Match": etag}
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+        assert resp.headers["ETag"] == etag
+
+    # Range requests are left to FileResponse
+    resp = await mock_http_client.get(
+        "/static/app.js",
+        headers={"Range": "bytes=0-6", "Accept-Encoding": "identity"},
+    )
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.text() == "console"
+
+
+async def test_memory_files_revalidated(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files in memory are reloaded when they change on disk."""
+    app = hass.http.app
+    path = tmp_path / "card.js"
+    path.write_text("old")
+    resource = CachingStaticResource("/local", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get("/local/card.js")
+    assert await resp.text() == "old"
+    resp = await mock_http_client.get("/local/card.js")
+    assert await resp.text() == "old"
+
+    path.write_text("new content")
+    resp = await mock_http_client.get("/local/card.js")
+    assert await resp.text() == "old"
+
+    with patch.object(static, "MEMORY_CACHE_REVALIDATE_INTERVAL", 0):
+        resp = await mock_http_client.get("/local/card.js")
+        assert await resp.text() == "new content"
+
+        path.unlink()
+        resp = await mock_http_client.get("/local/card.js")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_large_files_not_kept_in_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files larger than the memory limit are always read from disk."""
+    app = hass.http.app
+    (tmp_path / "large.bin").write_bytes(b"x" * 32)
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    with (
+        patch.object(static, "MEMORY_CACHE_MAX_FILE_SIZE", 16),
+        patch.object(
+            FileResponse, "prepare", autospec=True, side_effect=FileResponse.prepare
+        ) as mock_prepare,
+    ):
+        for _ in range(2):
+            resp = await mock_http_client.get("/static/large.bin")
+            assert resp.status == HTTPStatus.OK
+            assert await resp.read() == b"x" * 32
+        assert mock_prepare.call_count == 2
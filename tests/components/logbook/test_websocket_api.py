@@ -1567,6 +1567,67 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_live_streams_share_humanified_events(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live streams humanify each event only once."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["partial"] is True
+        await get_instance(hass).async_block_till_done()
+        await hass.async_block_till_done()
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert "partial" not in msg["event"]
+
+    with patch(
+        "homeassistant.components.logbook.websocket_api.async_event_to_row",
+        wraps=websocket_api.async_event_to_row,
+    ) as event_to_row_mock:
+        hass.states.async_set("light.small", STATE_OFF)
+        await hass.async_block_till_done()
+        events_by_msg_id = {}
+        for _ in range(2):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            events_by_msg_id[msg["id"]] = msg["event"]["events"]
+
+    assert event_to_row_mock.call_count == 1
+    assert events_by_msg_id[7] == events_by_msg_id[8]
+    assert events_by_msg_id[7] == [
+        {"entity_id": "light.small", "state": "off", "when": ANY}
+    ]
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id + 2, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -0,0 +1,59 @@
+"""Test recorder state attributes table manager."""
+
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import CACHE_SIZE
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+
+async def test_unchanged_attributes_are_serialized_once(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test attributes are not serialized again when they did not change."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    original = StateAttributes.shared_attrs_bytes_from_event
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        side_effect=original,
+    ) as mock_serialize:
+        hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.test", "3", {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 1
+
+        hass.states.async_set("sensor.test", "4", {"unit_of_measurement": "kW"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 2
+
+        hass.states.async_remove("sensor.test")
+        await async_wait_recording_done(hass)
+        assert "sensor.test" not in manager._last_serialized
+
+        hass.states.async_set("sensor.test", "5", {"unit_of_measurement": "kW"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 4
+        assert (
+            manager._last_serialized["sensor.test"][1]
+            == b'{"unit_of_measurement":"kW"}'
+        )
+
+
+async def test_last_serialized_attributes_are_bounded(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the serialized attributes per entity are kept in a bounded LRU."""
+    manager = recorder.get_instance(hass).state_attributes_manager
+    assert manager._last_serialized.get_size() == CACHE_SIZE
+
+    manager.adjust_lru_size(CACHE_SIZE * 2)
+    assert manager._last_serialized.get_size() == CACHE_SIZE * 2
+    assert manager._id_map.get_size() == CACHE_SIZE * 2
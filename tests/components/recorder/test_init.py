@@ -88,7 +88,10 @@ from .common import (
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
+    do_adhoc_statistics,
+    get_start_time,
     run_information_with_session,
+    statistics_during_period,
 )
 
 from tests.common import (
@@ -136,6 +139,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        state_sampler=None,
     )
 
 
@@ -652,6 +656,235 @@ async def test_saving_state_include_domains_globs(
     )
 
 
+def _recorded_sampled_states(hass: HomeAssistant) -> dict[str, list[str]]:
+    """Return the recorded states by entity_id."""
+    with session_scope(hass=hass, read_only=True) as session:
+        recorded: dict[str, list[str]] = {}
+        for state, entity_id in (
+            session.query(States.state, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ):
+            recorded.setdefault(entity_id, []).append(state)
+    return recorded
+
+
+async def test_saving_state_sampling(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sampling policies drop insignificant state changes."""
+    await async_setup_recorder_instance(
+        hass,
+        {
+            "sampling": {
+                "sensor": {"deadband": 1, "keep_last": True},
+                "sensor.rssi": {"min_interval": 30},
+            }
+        },
+    )
+    for power, rssi, other in (
+        ("10", "-60", "1"),
+        ("10.5", "-70", "1.1"),
+        ("10.8", "-70", "1.1"),
+        ("12", "-71", "1.1"),
+        ("12.5", "-71", "1.1"),
+        ("unavailable", "-71", "1.1"),
+    ):
+        hass.states.async_set("sensor.power", power)
+        hass.states.async_set("sensor.rssi", rssi)
+        hass.states.async_set("test.other", other)
+        freezer.tick(10)
+    await async_wait_recording_done(hass)
+
+    assert _recorded_sampled_states(hass) == {
+        "sensor.power": ["10", "10.8", "12", "12.5", "unavailable"],
+        "sensor.rssi": ["-60", "-71"],
+        "test.other": ["1", "1.1"],
+    }
+
+
+async def test_saving_state_sampling_always_records_transitions(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sampling never drops non-numeric or attribute only changes."""
+    await async_setup_recorder_instance(
+        hass, {"sampling": {"sensor": {"min_interval": 60, "deadband": 5}}}
+    )
+    for state, attributes in (
+        ("10", {}),
+        ("11", {}),
+        ("unavailable", {}),
+        ("12", {}),
+        ("13", {}),
+        ("13", {"friendly_name": "Power"}),
+        ("unknown", {"friendly_name": "Power"}),
+    ):
+        hass.states.async_set("sensor.power", state, attributes)
+        freezer.tick(1)
+    await async_wait_recording_done(hass)
+
+    assert _recorded_sampled_states(hass) == {
+        "sensor.power": ["10", "unavailable", "12", "13", "unknown"]
+    }
+
+
+async def test_saving_state_sampling_skips_sum_state_class(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    entity_registry: er.EntityRegistry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entities with a sum state class are never sampled."""
+    entity_registry.async_get_or_create(
+        "sensor",
+        "test",
+        "energy",
+        suggested_object_id="energy",
+        capabilities={"state_class": "total_increasing"},
+    )
+    entity_registry.async_get_or_create(
+        "sensor",
+        "test",
+        "power",
+        suggested_object_id="power",
+        capabilities={"state_class": "measurement"},
+    )
+    await async_setup_recorder_instance(
+        hass,
+        {
+            "sampling": {
+                "sensor": {"deadband": 5},
+                "sensor.energy": {"deadband": 5},
+                "sensor.power": {"deadband": 5},
+            }
+        },
+    )
+    assert "Sampling of sensor.energy is not supported" in caplog.text
+    assert "Sampling of sensor.power is not supported" not in caplog.text
+
+    for state in ("10", "11", "12"):
+        hass.states.async_set("sensor.energy", state, {"state_class": "total"})
+        hass.states.async_set("sensor.gas", state, {"state_class": "total"})
+        hass.states.async_set("sensor.power", state, {"state_class": "measurement"})
+        hass.states.async_set("sensor.other", state)
+    await async_wait_recording_done(hass)
+
+    assert _recorded_sampled_states(hass) == {
+        "sensor.energy": ["10", "11", "12"],
+        "sensor.gas": ["10", "11", "12"],
+        "sensor.power": ["10"],
+        "sensor.other": ["10"],
+    }
+    assert "Not sampling sensor.gas since the sum of its state class" in caplog.text
+    assert "Not sampling sensor.power" not in caplog.text
+
+
+async def test_saving_state_sampling_measurement_statistics(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test statistics of sampled measurements are compiled from every state."""
+    await async_setup_recorder_instance(
+        hass, {"sampling": {"sensor.power": {"deadband": 5}}}
+    )
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=5)
+    freezer.move_to(zero - timedelta(seconds=30))
+    hass.states.async_set("sensor.power", "10", attributes)
+    # The last state belongs to the next statistics period
+    for seconds, state in (
+        (60, "8"),
+        (120, "20"),
+        (180, "23"),
+        (240, "16"),
+        (330, "17"),
+    ):
+        freezer.move_to(zero + timedelta(seconds=seconds))
+        hass.states.async_set("sensor.power", state, attributes)
+    await async_wait_recording_done(hass)
+    assert _recorded_sampled_states(hass) == {"sensor.power": ["10", "20"]}
+
+    do_adhoc_statistics(hass, start=zero)
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, zero, period="5minute", types={"max", "mean", "min"}
+    )
+    assert stats == {
+        "sensor.power": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx((10 + 8 + 20 + 23 + 16) / 5),
+                "min": pytest.approx(8),
+                "max": pytest.approx(23),
+            }
+        ]
+    }
+
+
+async def test_saving_state_sampling_flushes_keep_last(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the last dropped state is recorded once min_interval has passed."""
+    await async_setup_recorder_instance(
+        hass,
+        {"sampling": {"sensor": {"min_interval": 30, "keep_last": True}}},
+    )
+    for state in ("10", "11", "12"):
+        hass.states.async_set("sensor.power", state)
+        freezer.tick(5)
+    await async_wait_recording_done(hass)
+    assert _recorded_sampled_states(hass) == {"sensor.power": ["10"]}
+
+    freezer.tick(30)
+    async_fire_time_changed(hass)
+    await async_wait_recording_done(hass)
+    assert _recorded_sampled_states(hass) == {"sensor.power": ["10", "12"]}
+
+    # The flushed state is the new reference for min_interval
+    hass.states.async_set("sensor.power", "13")
+    await async_wait_recording_done(hass)
+    assert _recorded_sampled_states(hass) == {"sensor.power": ["10", "12", "13"]}
+
+
+async def test_saving_state_sampling_flushes_keep_last_on_stop(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the last dropped state is recorded when the recorder stops."""
+    instance = await async_setup_recorder_instance(
+        hass,
+        {"sampling": {"sensor": {"min_interval": 30, "keep_last": True}}},
+    )
+    for state in ("10", "11", "12"):
+        hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+    assert _recorded_sampled_states(hass) == {"sensor.power": ["10"]}
+
+    with patch.object(
+        instance,
+        "_process_state_changed_event_into_session",
+        wraps=instance._process_state_changed_event_into_session,
+    ) as process_mock:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        await hass.async_stop()
+
+    assert [
+        call.args[0].data["new_state"].state for call in process_mock.call_args_list
+    ] == ["12"]
+
+
 async def test_saving_state_incl_entities(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
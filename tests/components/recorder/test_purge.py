@@ -296,6 +296,50 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("throttle_backlog", "passes", "throttled_passes"),
+    [(1000, 1, 0), (-1, 2, 2)],
+)
+async def test_purge_progress(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    throttle_backlog: int,
+    passes: int,
+    throttled_passes: int,
+) -> None:
+    """Test purge progress is tracked and passes are throttled on backlog."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.purge_progress is None
+
+    with patch(
+        "homeassistant.components.recorder.purge.PURGE_THROTTLE_BACKLOG",
+        throttle_backlog,
+    ):
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass)
+
+    progress = recorder_mock.purge_progress
+    assert progress is not None
+    assert progress.finished is True
+    assert progress.passes == passes
+    assert progress.throttled_passes == throttled_passes
+    assert progress.states_purged == 4
+    assert progress.events_purged == 4
+    assert progress.as_dict() == {
+        "purge_before": progress.purge_before.isoformat(),
+        "passes": passes,
+        "states_purged": 4,
+        "events_purged": 4,
+        "throttled_passes": throttled_passes,
+        "duration": progress.duration,
+        "rows_per_second": progress.rows_per_second,
+        "finished": True,
+    }
+
+
 async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old events."""
     await _add_test_events(hass)
@@ -404,6 +448,38 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_short_term_statistics_in_time_ranges(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test short term statistics are purged in batches of whole periods."""
+    utcnow = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        for days_ago in (12, 11, 10, 1):
+            start_ts = (utcnow - timedelta(days=days_ago)).timestamp()
+            session.add_all(
+                StatisticsShortTerm(start_ts=start_ts, state=days_ago) for _ in range(3)
+            )
+
+    purge_before = utcnow - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 4),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 4),
+    ):
+        # The first batch ends in the second period, which is purged entirely
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert not finished
+        with session_scope(hass=hass) as session:
+            assert session.query(StatisticsShortTerm).count() == 6
+
+        # The remaining period fits in a batch
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert finished
+
+    with session_scope(hass=hass) as session:
+        statistics = session.query(StatisticsShortTerm).all()
+        assert [statistic.state for statistic in statistics] == [1, 1, 1]
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 @pytest.mark.usefixtures("recorder_mock")
 async def test_purge_method(
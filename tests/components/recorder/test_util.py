@@ -20,6 +20,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, util
 from homeassistant.components.recorder.const import (
     DOMAIN,
+    SQLITE_READER_MMAP_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -35,6 +36,7 @@ from homeassistant.components.recorder.util import (
     MIN_VERSION_SQLITE,
     RETRYABLE_MYSQL_ERRORS,
     UPCOMING_MIN_VERSION_SQLITE,
+    bucket_bind_list,
     database_job_retry_wrapper,
     end_incomplete_runs,
     is_second_sunday,
@@ -945,7 +947,10 @@ async def test_write_lock_db(
             connection.execute(text("DROP TABLE events;"))
 
     instance.recorder_and_worker_thread_ids.add(threading.get_ident())
-    with util.write_lock_db_sqlite(instance), pytest.raises(OperationalError):
+    with (
+        util.write_lock_db_sqlite(instance),
+        pytest.raises(OperationalError, match="database is locked"),
+    ):
         # Database should be locked now, try writing SQL command
         # This needs to be called in another thread since
         # the lock method is BEGIN IMMEDIATE and since we have
@@ -956,6 +961,44 @@ async def test_write_lock_db(
         await instance.async_add_executor_job(_drop_table)
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_executor_connections_are_read_only(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test read only sessions on the database executor cannot write.
+
+    This is only supported for SQLite.
+    """
+    instance = await async_setup_recorder_instance(hass)
+    await hass.async_block_till_done()
+
+    def _query_only_and_mmap_size(read_only: bool) -> tuple[int, int]:
+        with session_scope(hass=hass, read_only=read_only) as session:
+            return (
+                session.execute(text("PRAGMA query_only")).scalar(),
+                session.execute(text("PRAGMA mmap_size")).scalar(),
+            )
+
+    def _drop_table() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            session.execute(text("DROP TABLE events;"))
+
+    assert await instance.async_add_executor_job(_query_only_and_mmap_size, True) == (
+        1,
+        SQLITE_READER_MMAP_SIZE,
+    )
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_executor_job(_drop_table)
+    # Sessions that are not read only can still write
+    assert await instance.async_add_executor_job(_query_only_and_mmap_size, False) == (
+        0,
+        SQLITE_READER_MMAP_SIZE,
+    )
+
+
 def test_is_second_sunday() -> None:
     """Test we can find the second sunday of the month."""
     assert is_second_sunday(datetime(2022, 1, 9, 0, 0, 0, tzinfo=dt_util.UTC)) is True
@@ -967,6 +1010,23 @@ def test_is_second_sunday() -> None:
     assert is_second_sunday(datetime(2022, 1, 10, 0, 0, 0, tzinfo=dt_util.UTC)) is False
 
 
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([], []),
+        ([1], [1]),
+        ([1, 2], [1, 2]),
+        ([1, 2, 3], [1, 2, 3, 3]),
+        ([1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 5, 5, 5]),
+        (list(range(200)), [*range(200), *[199] * 56]),
+        (list(range(257)), list(range(257))),
+    ],
+)
+def test_bucket_bind_list(values: list[int], expected: list[int]) -> None:
+    """Test bind lists are padded to a power of two length."""
+    assert bucket_bind_list(values) == expected
+
+
 def test_build_mysqldb_conv() -> None:
     """Test building the MySQLdb connect conv param."""
     mock_converters = Mock(conversions={"original": "preserved"})
@@ -9,6 +9,7 @@ from unittest.mock import ANY, patch
 from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
@@ -1996,6 +1997,97 @@ async def test_update_statistics_issues(
     assert response["result"] is None
 
 
+async def test_stage_timings(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the recorder reports the time spent in each stage."""
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/stage_timings", "reset": True})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["backlog"] == 0
+    assert set(result["stages"]) == {
+        "commit",
+        "event",
+        "lookup",
+        "purge",
+        "serialize",
+        "statistics",
+    }
+    event_timing = result["stages"]["event"]
+    assert event_timing["count"] >= 2
+    assert event_timing["total"] > 0
+    assert (
+        sum(bucket["count"] for bucket in event_timing["histogram"])
+        == (event_timing["count"])
+    )
+    assert event_timing["histogram"][-1]["le"] is None
+    assert result["stages"]["serialize"]["count"] >= 2
+    assert result["stages"]["commit"]["count"] >= 1
+    statement_cache = result["statement_cache"]
+    assert statement_cache["hits"] > 0
+    assert statement_cache["hit_rate"] == statement_cache["hits"] / (
+        statement_cache["hits"] + statement_cache["misses"]
+    )
+
+    await client.send_json_auto_id({"type": "recorder/stage_timings"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["stages"]["event"]["count"] == 0
+
+    def _lookup_missing_entity() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            recorder_mock.states_meta_manager.get_many(
+                ["sensor.missing"], session, False
+            )
+
+    # Lookups outside of the recorder thread are timed as well
+    await recorder_mock.async_add_executor_job(_lookup_missing_entity)
+    await client.send_json_auto_id({"type": "recorder/stage_timings"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["stages"]["lookup"]["count"] == 1
+
+
+async def test_stage_timings_statement_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test only statements that can be cached are counted."""
+    stage_timings = recorder_mock.stage_timings
+
+    def _execute_statements() -> list[tuple[int, int]]:
+        counts: list[tuple[int, int]] = []
+        with recorder_mock.engine.connect() as connection:
+            stage_timings.reset()
+            connection.exec_driver_sql("PRAGMA user_version")
+            counts.append(
+                (
+                    stage_timings.statement_cache_hits,
+                    stage_timings.statement_cache_misses,
+                )
+            )
+            for _ in range(2):
+                connection.execute(text("SELECT 'test_stage_timings_statement_cache'"))
+                counts.append(
+                    (
+                        stage_timings.statement_cache_hits,
+                        stage_timings.statement_cache_misses,
+                    )
+                )
+        return counts
+
+    assert await recorder_mock.async_add_executor_job(_execute_statements) == [
+        (0, 0),
+        (0, 1),
+        (1, 1),
+    ]
+
+
 async def test_clear_statistics(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2537,6 +2629,7 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
     }
@@ -17,6 +17,7 @@ from homeassistant.components.stream.const import (
     NUM_PLAYLIST_SEGMENTS,
 )
 from homeassistant.components.stream.core import Orientation, Part
+from homeassistant.components.stream.hls import HlsPlaylistView
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -383,6 +384,59 @@ async def test_hls_playlist_view(
     await stream.stop()
 
 
+async def test_hls_playlist_view_shares_render(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the hls playlist is only rendered again when the last segment changes."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for i in range(2):
+        hls.put(Segment(sequence=i, duration=SEGMENT_DURATION))
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    with patch.object(
+        HlsPlaylistView, "render", wraps=HlsPlaylistView.render
+    ) as mock_render:
+        for _ in range(2):
+            resp = await hls_client.get("/playlist.m3u8")
+            assert resp.status == HTTPStatus.OK
+            assert await resp.text() == make_playlist(
+                sequence=0, segments=[make_segment(0), make_segment(1)]
+            )
+        assert mock_render.call_count == 1
+
+        hls.put(Segment(sequence=2, duration=SEGMENT_DURATION))
+        await hass.async_block_till_done()
+        resp = await hls_client.get("/playlist.m3u8")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == make_playlist(
+            sequence=0,
+            segments=[make_segment(0), make_segment(1), make_segment(2)],
+        )
+        assert mock_render.call_count == 2
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
+async def test_segment_data_joined_once_complete() -> None:
+    """Test the data of a segment is only joined once it is complete."""
+    segment = Segment(sequence=0)
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=True, data=FAKE_PAYLOAD), duration=0
+    )
+    assert segment.get_data() == FAKE_PAYLOAD
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=False, data=FAKE_PAYLOAD), duration=2
+    )
+    data = segment.get_data()
+    assert data == FAKE_PAYLOAD * 2
+    assert segment.get_data() is data
+
+
 async def test_hls_max_segments(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -11,12 +11,14 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
+from homeassistant.components.http.metrics import HttpMetrics
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import ALL_STATES_JSON_CACHE
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -692,6 +694,27 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_cached_until_state_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states command serializes the states once per change."""
+    hass.states.async_set("greeting.hello", "world")
+
+    for id_ in (5, 6):
+        await websocket_client.send_json({"id": id_, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == id_
+        assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    cached = hass.data[ALL_STATES_JSON_CACHE]
+
+    hass.states.async_set("greeting.hello", "universe")
+    await websocket_client.send_json({"id": 7, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    assert hass.data[ALL_STATES_JSON_CACHE] != cached
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -2563,6 +2586,42 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_http_metrics(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting and resetting the HTTP metrics."""
+    await websocket_client.send_json({"id": 5, "type": "http/metrics"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+    metrics = hass.http.metrics = HttpMetrics()
+    metrics.add_request(("GET", "/api/states"), 0.002)
+    metrics.add_response_bytes(("GET", "/api/states"), 10)
+    metrics.add_middleware("auth_middleware", 0.0005)
+
+    await websocket_client.send_json({"id": 6, "type": "http/metrics", "reset": True})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert result["in_flight"] == 0
+    assert len(result["routes"]) == 1
+    assert result["routes"][0]["method"] == "GET"
+    assert result["routes"][0]["route"] == "/api/states"
+    assert result["routes"][0]["count"] == 1
+    assert result["routes"][0]["response_bytes"] == 10
+    assert result["middlewares"]["auth_middleware"]["count"] == 1
+    assert metrics.as_dict()["routes"] == []
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "http/metrics"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
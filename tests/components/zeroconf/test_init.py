@@ -515,6 +515,64 @@ async def test_zeroconf_no_match_manufacturer(hass: HomeAssistant) -> None:
     assert len(mock_config_flow.mock_calls) == 0
 
 
+@pytest.mark.usefixtures("mock_async_zeroconf")
+async def test_zeroconf_no_match_not_processed_until_properties_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test a record that did not match is only matched again when it changes."""
+
+    def http_only_service_update_mock(zeroconf, services, handlers):
+        """Call service update handler."""
+        for state_change in (
+            ServiceStateChange.Added,
+            ServiceStateChange.Updated,
+            ServiceStateChange.Updated,
+        ):
+            handlers[0](
+                zeroconf,
+                "_airplay._tcp.local.",
+                "s1000._airplay._tcp.local.",
+                state_change,
+            )
+
+    not_samsung = get_zeroconf_info_mock_manufacturer("Not Samsung Electronics")
+    samsung = get_zeroconf_info_mock_manufacturer("Samsung Electronics")
+    with (
+        patch.dict(
+            zc_gen.ZEROCONF,
+            {
+                "_airplay._tcp.local.": [
+                    {"domain": "samsungtv", "properties": {"manufacturer": "samsung*"}}
+                ]
+            },
+            clear=True,
+        ),
+        patch.object(hass.config_entries.flow, "async_init") as mock_config_flow,
+        patch.object(
+            zeroconf, "AsyncServiceBrowser", side_effect=http_only_service_update_mock
+        ),
+        patch(
+            "homeassistant.components.zeroconf.AsyncServiceInfo",
+            side_effect=[
+                not_samsung("_airplay._tcp.local.", "s1000._airplay._tcp.local."),
+                not_samsung("_airplay._tcp.local.", "s1000._airplay._tcp.local."),
+                samsung("_airplay._tcp.local.", "s1000._airplay._tcp.local."),
+            ],
+        ),
+        patch(
+            "homeassistant.components.zeroconf.info_from_service",
+            wraps=zeroconf.info_from_service,
+        ) as mock_info_from_service,
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert len(mock_info_from_service.mock_calls) == 2
+    assert len(mock_config_flow.mock_calls) == 1
+    assert mock_config_flow.mock_calls[0][1][0] == "samsungtv"
+
+
 @pytest.mark.usefixtures("mock_async_zeroconf")
 async def test_homekit_match_partial_space(hass: HomeAssistant) -> None:
     """Test configured options for a device are loaded via config entry."""
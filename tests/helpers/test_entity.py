@@ -1593,6 +1593,49 @@ async def test_friendly_name_updated(
     assert state.attributes.get(ATTR_FRIENDLY_NAME) == expected_friendly_name3
 
 
+async def test_friendly_name_reused_between_writes(hass: HomeAssistant) -> None:
+    """Test the device based friendly name is only rebuilt when it changes."""
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id="qwer",
+                    device_info={
+                        "identifiers": {("hue", "1234")},
+                        "name": "Device Bla",
+                    },
+                    has_entity_name=True,
+                    name="Entity Bla",
+                ),
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    ent = entity_platform.entities["test_domain.device_bla_entity_bla"]
+    friendly_name = ent._friendly_name_internal()
+    assert friendly_name == "Device Bla Entity Bla"
+    assert ent._friendly_name_internal() is friendly_name
+
+    ent._values["name"] = "Entity Bla2"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Device Bla Entity Bla2"
+
+
 async def test_translation_key(hass: HomeAssistant) -> None:
     """Test translation key property."""
     mock_entity1 = entity.Entity()
@@ -164,6 +164,41 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+@pytest.mark.parametrize("force_update", [False, True])
+async def test_polling_backs_off_unchanged_entities(
+    hass: HomeAssistant, force_update: bool
+) -> None:
+    """Test polling backs off for unchanged entities when MAX_SCAN_INTERVAL is set."""
+    platform = MockPlatform()
+    platform.MAX_SCAN_INTERVAL = timedelta(seconds=40)
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=10)
+    )
+    updates = 0
+
+    def update() -> None:
+        nonlocal updates
+        updates += 1
+
+    ent = MockEntity(should_poll=True)
+    ent._attr_force_update = force_update
+    ent.update = update
+    await entity_platform.async_add_entities([ent])
+
+    for _ in range(5):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Polled three times unchanged, then every other interval
+    assert updates == 4
+    assert entity_platform._polling_backoffs[ent.entity_id].multiplier == 2
+
+    entity_platform.async_reset_polling_backoff(ent.entity_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert updates == 5
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -1194,6 +1229,53 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_device_info_resolved_once_per_batch(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities sharing device info only resolve the device once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id=f"{device}-{idx}",
+                    device_info={
+                        "identifiers": {("hue", device)},
+                        "name": f"Device {device}",
+                    },
+                )
+                for device in ("1234", "5678")
+                for idx in range(5)
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 10
+    assert len(mock_get_or_create.mock_calls) == 2
+    for device_id in ("1234", "5678"):
+        device = device_registry.async_get_device(identifiers={("hue", device_id)})
+        assert len(er.async_entries_for_device(er.async_get(hass), device.id)) == 5
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
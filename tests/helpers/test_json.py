@@ -18,6 +18,7 @@ from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     JSONEncoder as DefaultHASSJSONEncoder,
     find_paths_unserializable_data,
+    json_bytes_array,
     json_bytes_sorted,
     json_bytes_strip_null,
     json_dumps,
@@ -182,6 +183,12 @@ def test_json_fragments() -> None:
     )
 
 
+def test_json_bytes_array() -> None:
+    """Test joining serialized values into an array."""
+    assert json_bytes_array([]) == b"[]"
+    assert json_bytes_array([b'"one"', b"2", b'{"k":3}']) == b'["one",2,{"k":3}]'
+
+
 def test_json_bytes_strip_null() -> None:
     """Test stripping nul from strings."""
 
@@ -0,0 +1,57 @@
+"""Test the polling backoff helper."""
+
+from datetime import timedelta
+
+from homeassistant.helpers.polling_backoff import (
+    POLLING_BACKOFF_UNCHANGED_POLLS,
+    PollingBackoff,
+)
+
+
+def test_backoff_grows_while_unchanged() -> None:
+    """Test the multiplier grows while polls are unchanged."""
+    backoff = PollingBackoff(timedelta(seconds=40))
+
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS - 1):
+        backoff.async_record(False, 10)
+    assert backoff.multiplier == 1
+
+    backoff.async_record(False, 10)
+    assert backoff.multiplier == 2
+
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS):
+        backoff.async_record(False, 10)
+    assert backoff.multiplier == 4
+
+    # The interval would exceed the max interval
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS):
+        backoff.async_record(False, 10)
+    assert backoff.multiplier == 4
+
+
+def test_backoff_resets_on_change() -> None:
+    """Test the multiplier snaps back when the data changes."""
+    backoff = PollingBackoff(timedelta(minutes=10))
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS):
+        backoff.async_record(False, 10)
+    assert backoff.multiplier == 2
+
+    backoff.async_record(True, 10)
+    assert backoff.multiplier == 1
+
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS):
+        backoff.async_record(False, 10)
+    backoff.async_reset()
+    assert backoff.multiplier == 1
+    assert backoff.async_tick()
+
+
+def test_backoff_tick() -> None:
+    """Test ticks skip base intervals while backed off."""
+    backoff = PollingBackoff(timedelta(minutes=10))
+    assert backoff.async_tick()
+    for _ in range(POLLING_BACKOFF_UNCHANGED_POLLS):
+        backoff.async_record(False, 10)
+    assert backoff.multiplier == 2
+
+    assert [backoff.async_tick() for _ in range(2)] == [False, True]
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -898,3 +899,154 @@ async def test_config_entry(hass: HomeAssistant) -> None:
         hass, _LOGGER, name="test", config_entry=another_entry
     )
     assert crd.config_entry is another_entry
+
+
+async def test_refresh_scheduler_shares_timers(hass: HomeAssistant) -> None:
+    """Test coordinators due in the same slot share one timer."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    crds = [get_crd(hass, DEFAULT_UPDATE_INTERVAL) for _ in range(5)]
+    unsubs = [crd.async_add_listener(lambda: None) for crd in crds]
+
+    assert scheduler.scheduled_count == 5
+    assert scheduler.timer_count == 1
+
+    async_fire_time_changed(hass, utcnow() + DEFAULT_UPDATE_INTERVAL)
+    await hass.async_block_till_done()
+    assert [crd.data for crd in crds] == [1] * 5
+    assert scheduler.scheduled_count == 5
+
+    for unsub in unsubs:
+        unsub()
+    assert scheduler.scheduled_count == 0
+    assert scheduler.timer_count == 0
+
+
+async def test_refresh_jitter_is_deterministic(hass: HomeAssistant) -> None:
+    """Test the refresh jitter is derived from the coordinator identity."""
+    entry = MockConfigEntry(entry_id="abc")
+    first = get_crd(hass, DEFAULT_UPDATE_INTERVAL, entry)
+    second = get_crd(hass, DEFAULT_UPDATE_INTERVAL, entry)
+    assert first._jitter_slot == second._jitter_slot
+    assert (
+        update_coordinator.REFRESH_SLOTS_PER_SECOND * 0.05
+        <= first._jitter_slot
+        <= update_coordinator.REFRESH_SLOTS_PER_SECOND * 0.5
+    )
+
+
+async def test_request_refresh_during_scheduled_refresh(
+    hass: HomeAssistant,
+) -> None:
+    """Test requests during a scheduled refresh share one follow-up refresh."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=refresh,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+    )
+    refresh_task = hass.async_create_task(crd._handle_refresh_interval())
+    await asyncio.sleep(0)
+    assert calls == 1
+    request_tasks = [
+        hass.async_create_task(crd.async_request_refresh()) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    # The requests wait for the scheduled refresh instead of fetching in parallel
+    assert calls == 1
+    release.set()
+    await refresh_task
+    await asyncio.gather(*request_tasks)
+
+    # The data of the scheduled refresh may predate the requests,
+    # so exactly one more fetch follows it
+    assert calls == 2
+    assert crd.data == 2
+    assert crd.refresh_statistics.coalesced_request_count == 2
+    assert crd.refresh_statistics.refresh_count == 2
+
+    await crd.async_shutdown()
+
+
+async def test_refresh_statistics(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test refresh latency and overrun statistics."""
+    stats = crd.refresh_statistics
+    assert stats.average_duration is None
+
+    with patch(
+        "homeassistant.helpers.update_coordinator.monotonic",
+        side_effect=[0, 1, 10, 25],
+    ):
+        await crd.async_refresh()
+        await crd.async_refresh()
+
+    assert stats.as_dict() == {
+        "refresh_count": 2,
+        "last_duration": 15,
+        "max_duration": 15,
+        "average_duration": 8,
+        "overrun_count": 1,
+        "coalesced_request_count": 0,
+        "last_schedule_lag": 0.0,
+        "max_schedule_lag": 0.0,
+    }
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval backs off while data is unchanged."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=AsyncMock(return_value=1),
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        max_update_interval=DEFAULT_UPDATE_INTERVAL * 4,
+    )
+    await crd.async_refresh()
+    unsub = crd.async_add_listener(lambda: None)
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    for _ in range(3):
+        await crd.async_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL * 2
+
+    for _ in range(3):
+        await crd.async_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL * 4
+
+    crd.update_method.return_value = 2
+    update_count = crd.update_method.call_count
+    freezer.tick(DEFAULT_UPDATE_INTERVAL * 2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == update_count
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL * 2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == update_count + 1
+    assert crd.data == 2
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    # Requesting a refresh snaps back to the base interval
+    for _ in range(3):
+        await crd.async_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL * 2
+    await crd.async_request_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+    unsub()
@@ -1541,6 +1541,33 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_generation(hass: HomeAssistant) -> None:
+    """Test the generation changes when a state is changed or removed."""
+    generation = hass.states.generation
+
+    hass.states.async_set("light.bowl", "on", {})
+    assert hass.states.generation != generation
+    generation = hass.states.generation
+
+    # Reporting an unchanged state does not change the generation
+    hass.states.async_set("light.bowl", "on", {})
+    assert hass.states.generation == generation
+
+    hass.states.async_set("light.bowl", "on", {}, True)
+    assert hass.states.generation != generation
+    generation = hass.states.generation
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert hass.states.generation != generation
+    generation = hass.states.generation
+
+    assert not hass.states.async_remove("light.not_exist")
+    assert hass.states.generation == generation
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.generation != generation
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}